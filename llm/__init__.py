@@ -1,5 +1,6 @@
-
+from .ollama_client import OllamaClient
+from .normalized_job import NormalizedJob
 from .job_scorer import EnhancedJobScorer
 from .resume_matcher import ResumeMatcher
 
-__all__ = ['EnhancedJobScorer', 'ResumeMatcher']
+__all__ = ['OllamaClient', 'NormalizedJob', 'EnhancedJobScorer', 'ResumeMatcher']
@@ -0,0 +1,138 @@
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Hashable, Optional
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+CACHE_FILENAME = 'llm_cache.sqlite3'
+
+
+def content_key(*parts: str) -> bytes:
+    """
+    Build a compact cache key from text fields.
+
+    Args:
+        parts: Strings identifying the content (title, company, ...).
+
+    Returns:
+        16-byte BLAKE2b digest of the joined parts.
+    """
+    return hashlib.blake2b('\0'.join(parts).encode('utf-8'), digest_size=16).digest()
+
+
+class LRUCache:
+    """
+    Small in-process least-recently-used cache.
+    Used to avoid repeating identical LLM calls within a run.
+    Safe to share between worker threads.
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self._data: 'OrderedDict[Hashable, Any]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value (marking it recent) or None."""
+        with self._lock:
+            try:
+                self._data.move_to_end(key)
+            except KeyError:
+                return None
+            return self._data[key]
+
+    def put(self, key: Hashable, value: Any):
+        """Store a value, evicting the oldest entry when full."""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def close(self):
+        """Nothing to release for the in-memory cache."""
+
+
+class PersistentCache(LRUCache):
+    """
+    LRU cache backed by a SQLite table so LLM results survive across runs.
+    Values must be JSON-serializable. The on-disk table is trimmed to the
+    most recently written max_rows entries when opened.
+    """
+
+    def __init__(self, path: str, table: str, maxsize: int = 4096, max_rows: int = 10000):
+        super().__init__(maxsize)
+        self.table = table
+        self._db_lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute(
+            f'CREATE TABLE IF NOT EXISTS {table} (key BLOB PRIMARY KEY, value TEXT NOT NULL, ts INTEGER NOT NULL)'
+        )
+        self._conn.execute(
+            f'DELETE FROM {table} WHERE key NOT IN (SELECT key FROM {table} ORDER BY ts DESC LIMIT ?)',
+            (max_rows,),
+        )
+
+    def get(self, key: bytes) -> Optional[Any]:
+        """Return the value from memory, falling back to disk."""
+        value = super().get(key)
+        if value is not None:
+            return value
+
+        with self._db_lock:
+            row = self._conn.execute(f'SELECT value FROM {self.table} WHERE key = ?', (key,)).fetchone()
+        if row is None:
+            return None
+
+        value = orjson.loads(row[0])
+        super().put(key, value)
+        return value
+
+    def put(self, key: bytes, value: Any):
+        """Store a value in memory and on disk."""
+        super().put(key, value)
+        try:
+            with self._db_lock:
+                self._conn.execute(
+                    f'INSERT OR REPLACE INTO {self.table} (key, value, ts) VALUES (?, ?, ?)',
+                    (key, orjson.dumps(value).decode(), int(time.time())),
+                )
+        except (sqlite3.Error, TypeError) as e:
+            logger.debug(f"Could not persist cache entry: {e}")
+
+    def close(self):
+        """Close the database connection."""
+        with self._db_lock:
+            self._conn.close()
+
+
+def open_cache(config, table: str) -> LRUCache:
+    """
+    Create the LLM result cache for a component.
+
+    Args:
+        config: Configuration object (llm_cache, data_dir).
+        table: Table name for this component's results.
+
+    Returns:
+        PersistentCache in data_dir when caching is enabled and the file can
+        be opened, otherwise an in-memory LRUCache.
+    """
+    if config.llm_cache:
+        try:
+            return PersistentCache(Path(config.data_dir) / CACHE_FILENAME, table)
+        except sqlite3.Error as e:
+            logger.warning(f"LLM cache unavailable, using memory only: {e}")
+    return LRUCache()
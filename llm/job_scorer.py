@@ -1,10 +1,16 @@
 
 import os
 import re
-import json
 import logging
-import subprocess
-from typing import Dict, Any, Optional, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, List, Union
+
+import orjson
+
+from .cache import content_key, open_cache
+from .normalized_job import NormalizedJob
+from .ollama_client import OllamaClient
+from .prompt_template import split_template
 
 logger = logging.getLogger(__name__)
 
@@ -16,25 +22,47 @@ class EnhancedJobScorer:
     """
     
     # High relevance keywords (score 9-10)
-    HIGH_RELEVANCE = [
+    HIGH_RELEVANCE = (
         'machine learning engineer', 'ml engineer', 'ai engineer',
         'deep learning engineer', 'data scientist', 'research scientist',
         'applied scientist', 'nlp engineer', 'computer vision engineer',
         'mlops engineer', 'ml platform', 'ai researcher', 'llm engineer',
-    ]
+    )
     
     # Medium relevance keywords (score 7-8)
-    MEDIUM_RELEVANCE = [
+    MEDIUM_RELEVANCE = (
         'data engineer', 'ml ', ' ml', ' ai ', 'ai ', 'analytics engineer',
         'research engineer', 'quantitative', 'machine learning',
         'artificial intelligence', 'neural network', 'deep learning',
-    ]
+    )
     
     # Low relevance keywords (score 5-6)
-    LOW_RELEVANCE = [
+    LOW_RELEVANCE = (
         'data analyst', 'business intelligence', 'python developer',
         'backend engineer', 'software engineer', 'full stack',
-    ]
+    )
+    
+    # Clearly non-AI/ML titles (score 2 when no AI/ML keyword appears anywhere)
+    NON_RELEVANT = (
+        'marketing', 'sales', 'hr', 'human resources', 'recruiter', 'recruiting',
+        'talent acquisition', 'account executive', 'account manager',
+        'customer support', 'customer success', 'office manager', 'accountant',
+        'legal counsel', 'paralegal', 'copywriter',
+    )
+    
+    # Whole words/phrases that make a posting worth an LLM call; jobs without
+    # any of them (or a medium-relevance keyword) anywhere are scored 3
+    AI_ML_SIGNALS = (
+        'machine learning', 'deep learning', 'reinforcement learning',
+        'artificial intelligence', 'ai', 'ml', 'mlops', 'llm', 'llms', 'genai',
+        'gen ai', 'generative', 'nlp', 'natural language', 'computer vision',
+        'neural', 'pytorch', 'tensorflow', 'keras', 'scikit-learn', 'hugging face',
+        'huggingface', 'transformers', 'langchain', 'rag', 'data science',
+        'data scientist', 'data scientists', 'data engineer', 'data engineering',
+        'data analyst', 'analytics', 'business intelligence', 'statistics',
+        'statistical', 'predictive', 'recommender', 'recommendation', 'quantitative',
+        'research scientist', 'applied scientist', 'research engineer',
+    )
     
     SCORING_PROMPT = """You are an AI/ML job relevance scorer. Analyze this job posting and score its relevance for AI/Machine Learning roles.
 
@@ -53,135 +81,213 @@ Respond with ONLY a JSON object:
 {{"score": <number 1-10>, "reason": "<brief 10-word explanation>", "is_ml_role": <true/false>}}
 """
     
+    # SCORING_PROMPT split around its fields for fast rendering
+    _SCORING_PARTS = split_template(SCORING_PROMPT, 'title', 'company', 'description')
+    
+    SCORING_PROMPT_BATCH = """You are an AI/ML job relevance scorer. Analyze each of the {count} job postings below and score its relevance for AI/Machine Learning roles.
+
+Jobs:
+{jobs}
+
+Scoring Criteria (1-10 scale):
+- 9-10: Core AI/ML role (ML Engineer, Data Scientist, AI Researcher, Deep Learning, NLP, Computer Vision, MLOps, LLM Engineer)
+- 7-8: AI/ML adjacent role (Data Engineer with ML, Backend with ML systems, Research roles)
+- 5-6: Roles with some AI/ML exposure (Data Analyst, Full Stack with AI features)
+- 1-4: Not AI/ML related (Generic software, unrelated positions)
+
+Respond with ONLY a JSON object containing one result per job, using the job numbers as ids:
+{{"results": [{{"id": <job number>, "score": <number 1-10>, "reason": "<brief 10-word explanation>", "is_ml_role": <true/false>}}, ...]}}
+"""
+    
+    BATCH_JOB_ENTRY = """{id}. Title: {title}
+   Company: {company}
+   Description: {description}"""
+    _BATCH_ENTRY_PARTS = split_template(BATCH_JOB_ENTRY, 'id', 'title', 'company', 'description')
+    
+    # Rough token budget reserved for each job's result in a batch response
+    BATCH_TOKENS_PER_RESULT = 40
+    
+    # JSON Schemas passed as Ollama's `format` so decoding is constrained
+    # to exactly the fields we read (score is emitted first)
+    SCORE_SCHEMA = {
+        'type': 'object',
+        'properties': {
+            'score': {'type': 'integer', 'minimum': 1, 'maximum': 10},
+            'reason': {'type': 'string', 'maxLength': 80},
+            'is_ml_role': {'type': 'boolean'},
+        },
+        'required': ['score'],
+    }
+    
+    BATCH_SCORE_SCHEMA = {
+        'type': 'object',
+        'properties': {
+            'results': {
+                'type': 'array',
+                'items': {
+                    'type': 'object',
+                    'properties': {
+                        'id': {'type': 'integer'},
+                        'score': {'type': 'integer', 'minimum': 1, 'maximum': 10},
+                        'reason': {'type': 'string', 'maxLength': 80},
+                        'is_ml_role': {'type': 'boolean'},
+                    },
+                    'required': ['id', 'score'],
+                },
+            },
+        },
+        'required': ['results'],
+    }
+    
+    # Completed "score" field in a (possibly partial) JSON response
+    SCORE_FIELD_RE = re.compile(r'"score"\s*:\s*(\d+)\s*[,}]')
+    
     def __init__(self, config):
         """Initialize the enhanced job scorer."""
         self.config = config
-        self.model = config.ollama_model
+        self.model = config.ollama_model_fast
+        self.deep_model = config.ollama_model_deep
+        self.client = OllamaClient(config.ollama_host, timeout=60)
+        self._score_cache = open_cache(config, 'scores')
+        
+        # Batches are sent concurrently; Ollama serves up to OLLAMA_NUM_PARALLEL at once
+        self._pool = ThreadPoolExecutor(max_workers=max(1, config.ollama_num_parallel))
+        
+        # One alternation per relevance tier for the keyword fallback
+        self._re_high = self._compile_keywords(self.HIGH_RELEVANCE)
+        self._re_med = self._compile_keywords(self.MEDIUM_RELEVANCE)
+        self._re_low = self._compile_keywords(self.LOW_RELEVANCE)
+        # Whole-word patterns for the title fast path ("HTML Engineer" is not an ML engineer)
+        self._re_high_title = self._compile_keywords(self.HIGH_RELEVANCE, whole_words=True)
+        self._re_non_relevant = self._compile_keywords(self.NON_RELEVANT, whole_words=True)
+        self._re_ai_ml_signal = self._compile_keywords(self.AI_ML_SIGNALS, whole_words=True)
+        
         self._verify_ollama()
-        logger.info(f"Enhanced job scorer initialized with model: {self.model}")
+        logger.info(f"Enhanced job scorer initialized with model: {self.model} (analysis: {self.deep_model})")
     
     def _verify_ollama(self):
         """Verify Ollama is available."""
-        try:
-            result = subprocess.run(
-                ['ollama', 'list'],
-                capture_output=True,
-                text=True,
-                timeout=10,
-                encoding='utf-8',
-                errors='ignore'
-            )
-            if result.returncode != 0:
-                logger.warning("Ollama may not be running. Using fallback scoring.")
-        except Exception as e:
-            logger.warning(f"Ollama not available: {e}. Using fallback scoring.")
-    
-    def _call_ollama(self, prompt: str) -> Optional[str]:
-        """Call Ollama with a prompt."""
-        try:
-            result = subprocess.run(
-                ['ollama', 'run', self.model, prompt],
-                capture_output=True,
-                text=True,
-                timeout=60,
-                encoding='utf-8',
-                errors='ignore'
-            )
-            
-            if result.returncode == 0:
-                return result.stdout.strip()
-            return None
-            
-        except subprocess.TimeoutExpired:
-            logger.warning("Ollama request timed out")
-            return None
-        except Exception as e:
-            logger.debug(f"Ollama call failed: {e}")
-            return None
+        models = self.client.list_models()
+        if models is None:
+            logger.warning(f"Ollama not available at {self.client.host}. Using fallback scoring.")
+        else:
+            for model in {self.model, self.deep_model}:
+                if not any(name == model or name.split(':')[0] == model for name in models):
+                    logger.warning(f"Ollama model '{model}' not found. Run: ollama pull {model}")
+    
+    def _call_ollama(self, prompt: str, format='json', stop=None, model: str = None) -> Optional[str]:
+        """Call Ollama with a prompt, optionally stopping once stop(text) matches."""
+        return self.client.generate(
+            model or self.model,
+            prompt,
+            format=format,
+            options={'num_ctx': self.config.ollama_num_ctx},
+            stop=stop,
+        )
     
     def _parse_llm_response(self, response: str) -> Optional[Dict[str, Any]]:
         """Parse LLM JSON response."""
         if not response:
             return None
         
-        # Try direct JSON parse
+        # Try direct JSON parse (anything but an object, e.g. a bare number, is unusable)
         try:
-            return json.loads(response)
-        except json.JSONDecodeError:
+            result = orjson.loads(response)
+            return result if isinstance(result, dict) else None
+        except orjson.JSONDecodeError:
             pass
         
-        # Try to extract JSON from response
-        json_match = re.search(r'\{[^{}]*"score"\s*:\s*(\d+)[^{}]*\}', response, re.DOTALL)
-        if json_match:
-            try:
-                return json.loads(json_match.group(0))
-            except:
-                pass
-        
-        # Try to extract just the score
-        score_match = re.search(r'"score"\s*:\s*(\d+)', response)
+        # Generation may have been stopped right after the score field
+        score_match = self.SCORE_FIELD_RE.search(response)
         if score_match:
-            return {'score': int(score_match.group(1)), 'reason': 'Extracted from response'}
-        
-        # Try to find any number 1-10
-        numbers = re.findall(r'\b([1-9]|10)\b', response)
-        if numbers:
-            return {'score': int(numbers[0]), 'reason': 'Number extracted'}
+            return {'score': int(score_match.group(1))}
         
         return None
     
-    def _fallback_score(self, job: Dict[str, Any]) -> int:
+    @staticmethod
+    def _compile_keywords(keywords, whole_words: bool = False) -> re.Pattern:
+        """Compile literal keywords into one alternation regex."""
+        pattern = '|'.join(map(re.escape, keywords))
+        return re.compile(r'\b(?:' + pattern + r')\b' if whole_words else pattern)
+    
+    def _fallback_score(self, job: Union[Dict[str, Any], NormalizedJob]) -> int:
         """Fallback scoring using keyword matching."""
-        title = job.get('title', '').lower()
-        description = job.get('description', '').lower()
-        combined = f"{title} {description}"
+        return self._fallback_score_lower(NormalizedJob.from_dict(job).combined_lower)
+    
+    def _fallback_score_lower(self, combined_lower: str) -> int:
+        """Keyword score for lowercased title + description text."""
+        if self._re_high.search(combined_lower):
+            return 9
+        if self._re_med.search(combined_lower):
+            return 7
+        if self._re_low.search(combined_lower):
+            return 5
         
-        # Check high relevance
-        for keyword in self.HIGH_RELEVANCE:
-            if keyword in combined:
-                return 9
+        return 3
+    
+    def _quick_score(self, job: NormalizedJob) -> Optional[int]:
+        """
+        Score obvious jobs without the LLM.
         
-        # Check medium relevance
-        for keyword in self.MEDIUM_RELEVANCE:
-            if keyword in combined:
-                return 7
+        Returns:
+            10 for high-relevance titles, 2 for clearly unrelated ones,
+            3 for postings without any AI/ML signal, or None when the
+            job needs the LLM.
+        """
+        if not self.config.llm_only_ambiguous:
+            return None
         
-        # Check low relevance
-        for keyword in self.LOW_RELEVANCE:
-            if keyword in combined:
-                return 5
+        if self._re_high_title.search(job.title_lower):
+            return 10
         
-        return 3
+        if self._re_non_relevant.search(job.title_lower):
+            if not (self._re_high.search(job.combined_lower) or self._re_med.search(job.combined_lower)):
+                return 2
+        
+        # Cheap prefilter: nothing AI/ML-related anywhere in the posting
+        if not (self._re_med.search(job.combined_lower) or self._re_ai_ml_signal.search(job.combined_lower)):
+            return 3
+        
+        return None
     
-    def score_relevance(self, job: Dict[str, Any]) -> int:
+    def score_relevance(self, job: Union[Dict[str, Any], NormalizedJob]) -> int:
         """
         Score a job's relevance for AI/ML positions.
         
         Args:
-            job: Job dictionary with title, company, description.
+            job: Job dictionary with title, company, description (or NormalizedJob).
             
         Returns:
             Integer score from 1-10.
         """
-        title = job.get('title', 'Unknown')
-        company = job.get('company', 'Unknown')
-        description = job.get('description', '')[:500]  # Truncate
+        job = NormalizedJob.from_dict(job)
+        title = job.title
+        company = job.company
+        description = job.description[:500]  # Truncate
+        
+        score = self._quick_score(job)
+        if score is not None:
+            logger.debug(f"Title score for '{title}': {score}")
+            return score
+        
+        key = self._cache_key(job)
+        cached = self._score_cache.get(key)
+        if cached is not None:
+            return cached
         
         # Build prompt
-        prompt = self.SCORING_PROMPT.format(
-            title=title,
-            company=company,
-            description=description or 'No description available'
-        )
+        a, b, c, d = self._SCORING_PARTS
+        prompt = ''.join((a, title, b, company, c, description or 'No description available', d))
         
-        # Try LLM scoring
-        response = self._call_ollama(prompt)
+        # Try LLM scoring; only the score is needed, so stop generating once it is complete
+        response = self._call_ollama(prompt, format=self.SCORE_SCHEMA, stop=self.SCORE_FIELD_RE.search)
         
         if response:
             result = self._parse_llm_response(response)
             if result and 'score' in result:
                 score = max(1, min(10, int(result['score'])))
                 logger.debug(f"LLM score for '{title}': {score}")
+                self._score_cache.put(key, score)
                 return score
         
         # Fallback to keyword scoring
@@ -189,6 +295,158 @@ Respond with ONLY a JSON object:
         logger.debug(f"Fallback score for '{title}': {score}")
         return score
     
+    def score_relevance_many(self, jobs: List[Union[Dict[str, Any], NormalizedJob]], batch_size: int = 8) -> List[int]:
+        """
+        Score several jobs, packing up to batch_size jobs into each LLM request.
+        
+        The scoring rubric is sent once per batch instead of once per job.
+        Batches shrink automatically when the prompt would not fit in num_ctx.
+        
+        Args:
+            jobs: List of job dictionaries.
+            batch_size: Maximum number of jobs per request.
+            
+        Returns:
+            List of integer scores (1-10), in the same order as jobs.
+        """
+        jobs = [NormalizedJob.from_dict(job) for job in jobs]
+        
+        # Only send ambiguous jobs without a cached score to the LLM
+        scores = [self._quick_score(job) for job in jobs]
+        scores = [
+            self._score_cache.get(self._cache_key(job)) if score is None else score
+            for job, score in zip(jobs, scores)
+        ]
+        pending = [i for i, score in enumerate(scores) if score is None]
+        for i, score in zip(pending, self._score_uncached([jobs[i] for i in pending], batch_size)):
+            scores[i] = score
+        
+        return scores
+    
+    def _score_uncached(self, jobs: List[NormalizedJob], batch_size: int) -> List[int]:
+        """
+        Score jobs in context-sized batches, without consulting the cache.
+        
+        Identical postings are scored once. Jobs are sorted by prompt size and
+        packed greedily, so similar-length jobs share a batch and each batch
+        is filled as far as num_ctx allows.
+        """
+        groups = {}
+        for i, job in enumerate(jobs):
+            groups.setdefault(self._cache_key(job), []).append(i)
+        ordered = sorted(groups.values(), key=lambda group: self._entry_tokens(jobs[group[0]]))
+        
+        base = self._estimate_tokens(self.SCORING_PROMPT_BATCH)
+        batches, batch, used = [], [], base
+        for group in ordered:
+            cost = self._entry_tokens(jobs[group[0]])
+            if batch and (len(batch) >= batch_size or used + cost > self.config.ollama_num_ctx):
+                batches.append(batch)
+                batch, used = [], base
+            batch.append(group)
+            used += cost
+        if batch:
+            batches.append(batch)
+        
+        # Batches run concurrently on the pool; map() keeps their order
+        batch_jobs = [[jobs[group[0]] for group in batch] for batch in batches]
+        scores = [0] * len(jobs)
+        for batch, batch_scores in zip(batches, self._pool.map(self._score_jobs_batch, batch_jobs)):
+            for group, score in zip(batch, batch_scores):
+                for i in group:
+                    scores[i] = score
+        
+        return scores
+    
+    def _score_jobs_batch(self, batch_jobs: List[NormalizedJob]) -> List[int]:
+        """Build and score one batch (runs on a pool thread)."""
+        return self._score_batch(batch_jobs, self._build_batch_prompt(batch_jobs))
+    
+    def _entry_tokens(self, job: NormalizedJob) -> int:
+        """Estimated tokens one job adds to a batch (entry text + its result)."""
+        length = (
+            len(self.BATCH_JOB_ENTRY)
+            + len(job.title)
+            + len(job.company)
+            + len(job.description[:500] or 'No description available')
+        )
+        return length // 4 + self.BATCH_TOKENS_PER_RESULT
+    
+    def _build_batch_prompt(self, jobs: List[NormalizedJob]) -> str:
+        """Build a numbered multi-job scoring prompt."""
+        a, b, c, d, e = self._BATCH_ENTRY_PARTS
+        entries = [
+            ''.join((
+                a, str(i),
+                b, job.title,
+                c, job.company,
+                d, job.description[:500] or 'No description available',
+                e,
+            ))
+            for i, job in enumerate(jobs, 1)
+        ]
+        return self.SCORING_PROMPT_BATCH.format(count=len(jobs), jobs='\n\n'.join(entries))
+    
+    def _cache_key(self, job: NormalizedJob) -> bytes:
+        """Cache key for a job's score (model + the fields the prompt uses)."""
+        return content_key(self.model, job.title, job.company, job.description[:500])
+    
+    @staticmethod
+    def _estimate_tokens(text: str) -> int:
+        """Rough token estimate (~4 characters per token)."""
+        return len(text) // 4
+    
+    def _score_batch(self, jobs: List[NormalizedJob], prompt: str) -> List[int]:
+        """Score one batch, falling back to per-job scoring on parse failure."""
+        if len(jobs) == 1:
+            return [self.score_relevance(jobs[0])]
+        
+        results = self._parse_batch_response(self._call_ollama(prompt, format=self.BATCH_SCORE_SCHEMA))
+        if not results:
+            logger.debug("Batch response unusable, scoring jobs individually")
+            return [self.score_relevance(job) for job in jobs]
+        
+        scores = []
+        for i, job in enumerate(jobs, 1):
+            score = results.get(i)
+            if score is None:
+                score = self.score_relevance(job)
+            else:
+                logger.debug(f"LLM batch score for '{job.title}': {score}")
+                self._score_cache.put(self._cache_key(job), score)
+            scores.append(score)
+        
+        return scores
+    
+    def _parse_batch_response(self, response: Optional[str]) -> Dict[int, int]:
+        """Parse a batch response into a {job number: score} mapping."""
+        if not response:
+            return {}
+        
+        try:
+            data = orjson.loads(response)
+        except orjson.JSONDecodeError:
+            return {}
+        
+        if isinstance(data, dict):
+            data = data.get('results', [])
+        if not isinstance(data, list):
+            return {}
+        
+        results = {}
+        for item in data:
+            try:
+                results[int(item['id'])] = max(1, min(10, int(item['score'])))
+            except (KeyError, TypeError, ValueError):
+                continue
+        
+        return results
+    
+    def close(self):
+        """Shut down the request thread pool and close the score cache."""
+        self._pool.shutdown(wait=True)
+        self._score_cache.close()
+    
     def analyze_job_details(self, job: Dict[str, Any]) -> Dict[str, Any]:
         """
         Perform detailed analysis of a job posting.
@@ -213,14 +471,14 @@ Extract and respond with JSON only:
 }}
 """
         
-        response = self._call_ollama(analysis_prompt)
+        response = self._call_ollama(analysis_prompt, model=self.deep_model)
         
         if response:
             try:
                 # Find JSON in response
                 json_match = re.search(r'\{[\s\S]*\}', response)
                 if json_match:
-                    return json.loads(json_match.group(0))
+                    return orjson.loads(json_match.group(0))
             except:
                 pass
         
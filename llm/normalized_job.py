@@ -0,0 +1,44 @@
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Union
+
+
+@dataclass(slots=True)
+class NormalizedJob:
+    """
+    Job fields used by the scorer and matcher, with defaults applied and
+    lowercased text computed once instead of in every method.
+    """
+
+    title: str
+    company: str
+    description: str
+    title_lower: str
+    combined_lower: str
+    skills: FrozenSet[str]
+
+    @classmethod
+    def from_dict(cls, job: Union[Dict[str, Any], 'NormalizedJob']) -> 'NormalizedJob':
+        """
+        Build a NormalizedJob from a job dictionary.
+
+        Args:
+            job: Job dictionary (an existing NormalizedJob is returned as is).
+
+        Returns:
+            NormalizedJob instance.
+        """
+        if isinstance(job, cls):
+            return job
+
+        title = job.get('title', 'Unknown')
+        description = job.get('description', '')
+        title_lower = title.lower()
+
+        return cls(
+            title=title,
+            company=job.get('company', 'Unknown'),
+            description=description,
+            title_lower=title_lower,
+            combined_lower=f"{title_lower} {description.lower()}",
+            skills=frozenset(map(str.lower, job.get('skills') or ())),
+        )
@@ -0,0 +1,135 @@
+import logging
+from typing import Dict, Any, Optional, Callable, List, Union
+
+import orjson
+import requests
+
+logger = logging.getLogger(__name__)
+
+# Shared keep-alive pool for every client (scorer and matcher reuse connections)
+_session = requests.Session()
+_session.headers.update({'Content-Type': 'application/json'})
+
+
+class OllamaClient:
+    """
+    HTTP client for a local Ollama server.
+    All instances share one keep-alive session.
+    """
+
+    DEFAULT_HOST = "http://localhost:11434"
+
+    def __init__(self, host: str = None, timeout: int = 60):
+        """
+        Initialize the client.
+
+        Args:
+            host: Ollama server address (OLLAMA_HOST format).
+            timeout: Default request timeout in seconds.
+        """
+        host = (host or self.DEFAULT_HOST).rstrip('/')
+        if not host.startswith(('http://', 'https://')):
+            host = f"http://{host}"
+
+        self.host = host
+        self.timeout = timeout
+        self.session = _session
+
+    def version(self) -> Optional[str]:
+        """Return the server version, or None if the server is unreachable."""
+        try:
+            response = self.session.get(f"{self.host}/api/version", timeout=10)
+            response.raise_for_status()
+            return response.json().get('version')
+        except Exception as e:
+            logger.debug(f"Ollama version check failed: {e}")
+            return None
+
+    def list_models(self) -> Optional[List[str]]:
+        """
+        List locally available models.
+
+        Returns:
+            Model names, or None if the server is unreachable.
+        """
+        try:
+            response = self.session.get(f"{self.host}/api/tags", timeout=10)
+            response.raise_for_status()
+            return [m.get('name', '') for m in response.json().get('models', [])]
+        except Exception as e:
+            logger.debug(f"Ollama model list failed: {e}")
+            return None
+
+    def generate(
+        self,
+        model: str,
+        prompt: str,
+        format: Union[str, Dict[str, Any]] = None,
+        options: Dict[str, Any] = None,
+        timeout: int = None,
+        stop: Callable[[str], Any] = None,
+    ) -> Optional[str]:
+        """
+        Run a single completion.
+
+        When stop is given the response is streamed and the connection is
+        closed (which aborts generation) as soon as stop(text) is truthy.
+
+        Args:
+            model: Model name (e.g. llama3).
+            prompt: Prompt text.
+            format: Optional output format: 'json' or a JSON Schema dict
+                (constrained decoding, Ollama 0.5+).
+            options: Optional model options (e.g. num_ctx).
+            timeout: Request timeout override in seconds.
+            stop: Optional predicate on the text generated so far.
+
+        Returns:
+            Generated text or None if the call failed.
+        """
+        payload = {'model': model, 'prompt': prompt, 'stream': stop is not None}
+        if format:
+            payload['format'] = format
+        if options:
+            payload['options'] = options
+
+        try:
+            if stop is not None:
+                return self._generate_stream(payload, timeout or self.timeout, stop)
+
+            response = self.session.post(
+                f"{self.host}/api/generate",
+                data=orjson.dumps(payload),
+                timeout=timeout or self.timeout,
+            )
+            response.raise_for_status()
+            return orjson.loads(response.content).get('response', '').strip() or None
+
+        except requests.exceptions.Timeout:
+            logger.warning("Ollama request timed out")
+            return None
+        except Exception as e:
+            logger.debug(f"Ollama call failed: {e}")
+            return None
+
+    def _generate_stream(self, payload: Dict[str, Any], timeout: int, stop: Callable[[str], Any]) -> Optional[str]:
+        """Read NDJSON chunks until done or until stop() matches."""
+        text = ''
+
+        with self.session.post(
+            f"{self.host}/api/generate",
+            data=orjson.dumps(payload),
+            timeout=timeout,
+            stream=True,
+        ) as response:
+            response.raise_for_status()
+
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                chunk = orjson.loads(line)
+                text += chunk.get('response', '')
+                if chunk.get('done') or stop(text):
+                    break
+
+        return text.strip() or None
@@ -0,0 +1,34 @@
+import string
+from typing import Tuple
+
+
+def split_template(template: str, *fields: str) -> Tuple[str, ...]:
+    """
+    Pre-split a str.format template into literal segments around its fields.
+
+    Rendering then becomes a single ''.join of segments and values, which
+    skips re-parsing the template on every call. Escaped braces ({{ }}) are
+    resolved here once.
+
+    Args:
+        template: Format template with plain {name} fields.
+        fields: Expected field names, in template order.
+
+    Returns:
+        Tuple of len(fields) + 1 literal strings.
+    """
+    segments = ['']
+    found = []
+
+    for literal, field, format_spec, conversion in string.Formatter().parse(template):
+        segments[-1] += literal
+        if field is not None:
+            if format_spec or conversion:
+                raise ValueError(f"Unsupported format spec for field '{field}'")
+            found.append(field)
+            segments.append('')
+
+    if tuple(found) != fields:
+        raise ValueError(f"Template fields {found} do not match {list(fields)}")
+
+    return tuple(segments)
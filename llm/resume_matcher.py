@@ -1,14 +1,24 @@
 
 import os
 import re
-import json
 import logging
-import subprocess
+from collections import Counter
+from itertools import islice
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Set
+from typing import Dict, Any, List, Optional, Set, Tuple, Union
+
+import orjson
+
+from .cache import content_key, open_cache
+from .normalized_job import NormalizedJob
+from .ollama_client import OllamaClient
+from .prompt_template import split_template
 
 logger = logging.getLogger(__name__)
 
+# Compiled skill regex + implied-skill map, built once per matcher class
+_COMPILED_SKILL_PATTERNS: Dict[type, tuple] = {}
+
 
 class ResumeMatcher:
     """
@@ -80,15 +90,69 @@ Analyze the match and respond with JSON only:
     "match_summary": "<brief explanation>"
 }}
 """
+    
+    # JSON Schema for MATCH_PROMPT responses (Ollama constrained decoding)
+    MATCH_SCHEMA = {
+        'type': 'object',
+        'properties': {
+            'match_score': {'type': 'integer', 'minimum': 1, 'maximum': 10},
+            'matching_skills': {'type': 'array', 'items': {'type': 'string'}, 'maxItems': 10},
+            'missing_skills': {'type': 'array', 'items': {'type': 'string'}, 'maxItems': 10},
+            'match_summary': {'type': 'string', 'maxLength': 120},
+        },
+        'required': ['match_score', 'matching_skills', 'missing_skills', 'match_summary'],
+    }
+    
+    # MATCH_PROMPT split around its fields for fast rendering
+    _MATCH_PARTS = split_template(MATCH_PROMPT, 'resume_summary', 'title', 'company', 'description')
+    
+    MATCH_PROMPT_BATCH = """You are a resume-job matcher. Compare the candidate's skills with the requirements of each of the {count} jobs below.
+
+Candidate Profile:
+{resume_summary}
+
+Jobs:
+{jobs}
+
+Respond with ONLY a JSON object containing one result per job, using the job numbers as ids:
+{{"results": [{{"id": <job number>, "match_score": <1-10>, "matching_skills": ["skill1", ...], "missing_skills": ["skill1", ...], "match_summary": "<brief explanation>"}}, ...]}}
+"""
+    
+    MATCH_BATCH_SCHEMA = {
+        'type': 'object',
+        'properties': {
+            'results': {
+                'type': 'array',
+                'items': {
+                    'type': 'object',
+                    'properties': {'id': {'type': 'integer'}, **MATCH_SCHEMA['properties']},
+                    'required': ['id', *MATCH_SCHEMA['required']],
+                },
+            },
+        },
+        'required': ['results'],
+    }
+    
+    BATCH_JOB_ENTRY = """{id}. Title: {title}
+   Company: {company}
+   Description: {description}"""
+    _BATCH_ENTRY_PARTS = split_template(BATCH_JOB_ENTRY, 'id', 'title', 'company', 'description')
 
     def __init__(self, config):
         """Initialize the resume matcher."""
         self.config = config
         self.model = config.ollama_model
+        self.client = OllamaClient(config.ollama_host, timeout=90)
+        self._match_cache = open_cache(config, 'matches')
+        # Raw LLM resume analysis, reused until the resume or model changes
+        self._analysis_cache = open_cache(config, 'resume_analysis')
         self.user_skills: Set[str] = set()
         self.resume_text: str = ""
         self.experience_level: str = "unknown"
         
+        # All skill patterns as a single regex (compiled on first use, then shared)
+        self._skill_re, self._implied_skills = self._get_skill_patterns()
+        
         # Load resume and extract skills
         self._load_resume()
         self._load_user_skills()
@@ -105,68 +169,119 @@ Analyze the match and respond with JSON only:
                     self.resume_text = f.read()
                 logger.info(f"Loaded resume from {resume_path}")
                 
-                # Extract skills from resume
-                extracted = self._extract_skills_from_text(self.resume_text)
-                self.user_skills.update(extracted)
+                # Extract skills from resume (cached by content hash)
+                self.user_skills.update(self._resume_skills())
                 
             except Exception as e:
                 logger.warning(f"Could not load resume: {e}")
         else:
             logger.info("No resume file found. Using configured skills only.")
     
+    def _resume_skills(self) -> Set[str]:
+        """Skills in the resume, reusing the on-disk result for unchanged resumes."""
+        # The skill vocabulary is part of the key so pattern changes invalidate it
+        digest = content_key(self.resume_text, self._skill_re.pattern).hex()
+        cache_path = Path(self.config.data_dir) / '.cache' / f"resume_{digest}.json"
+        
+        if cache_path.exists():
+            try:
+                with open(cache_path, 'rb') as f:
+                    return set(orjson.loads(f.read()))
+            except Exception as e:
+                logger.debug(f"Ignoring unreadable resume cache: {e}")
+        
+        skills = self._extract_skills_from_text(self.resume_text)
+        
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix('.tmp')
+            with open(tmp_path, 'wb') as f:
+                f.write(orjson.dumps(sorted(skills)))
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            logger.debug(f"Could not write resume cache: {e}")
+        
+        return skills
+    
     def _load_user_skills(self):
         """Load user skills from configuration."""
         if self.config.user_skills:
             self.user_skills.update(skill.lower() for skill in self.config.user_skills)
     
+    @classmethod
+    def _get_skill_patterns(cls):
+        """Return the compiled skill patterns for this class, compiling them once."""
+        compiled = _COMPILED_SKILL_PATTERNS.get(cls)
+        if compiled is None:
+            compiled = _COMPILED_SKILL_PATTERNS[cls] = cls._compile_skill_patterns()
+        return compiled
+    
+    @classmethod
+    def _compile_skill_patterns(cls):
+        """
+        Compile SKILL_PATTERNS into one alternation regex.
+        
+        Returns:
+            Tuple of (compiled regex, map of skill -> skills it contains).
+        """
+        # Longest first so multi-word skills win over their prefixes
+        # (ties broken alphabetically so the pattern is stable across runs)
+        patterns = sorted(
+            {pattern for patterns in cls.SKILL_PATTERNS.values() for pattern in patterns},
+            key=lambda pattern: (-len(pattern), pattern),
+        )
+        skill_re = re.compile(r'\b(' + '|'.join(patterns) + r')\b')
+        
+        # A single scan reports only the longest skill at each position, so record
+        # shorter skills contained in longer ones (e.g. 'azure' in 'azure ml')
+        implied = {}
+        for pattern in patterns:
+            skill = pattern.replace('\\+\\+', '++').replace('\\', '')
+            contained = {
+                other.replace('\\+\\+', '++').replace('\\', '')
+                for other in patterns
+                if other != pattern and re.search(rf'\b{other}\b', skill)
+            }
+            if contained:
+                implied[skill] = contained
+        
+        return skill_re, implied
+    
     def _extract_skills_from_text(self, text: str) -> Set[str]:
         """Extract skills from text using pattern matching."""
-        skills = set()
-        text_lower = text.lower()
+        return self._extract_skills_from_lower(text.lower())
+    
+    def _extract_skills_from_lower(self, text_lower: str) -> Set[str]:
+        """Extract skills from text that is already lowercased."""
+        # findall collects the matches in C; implied skills are then added once
+        # per distinct skill instead of once per occurrence
+        skills = set(self._skill_re.findall(text_lower))
         
-        for category, patterns in self.SKILL_PATTERNS.items():
-            for pattern in patterns:
-                # Use word boundaries for better matching
-                if re.search(rf'\b{pattern}\b', text_lower):
-                    # Normalize skill name
-                    skill = pattern.replace('\\+\\+', '++').replace('\\', '')
-                    skills.add(skill)
+        for skill in skills & self._implied_skills.keys():
+            skills.update(self._implied_skills[skill])
         
         return skills
     
-    def _call_ollama(self, prompt: str) -> Optional[str]:
+    def _call_ollama(self, prompt: str, format='json') -> Optional[str]:
         """Call Ollama with a prompt."""
-        try:
-            result = subprocess.run(
-                ['ollama', 'run', self.model, prompt],
-                capture_output=True,
-                text=True,
-                timeout=90,
-                encoding='utf-8',
-                errors='ignore'
-            )
-            
-            if result.returncode == 0:
-                return result.stdout.strip()
-            return None
-            
-        except Exception as e:
-            logger.debug(f"Ollama call failed: {e}")
-            return None
+        return self.client.generate(self.model, prompt, format=format)
     
-    def _keyword_match(self, job: Dict[str, Any]) -> Dict[str, Any]:
-        """Fallback keyword-based matching."""
-        job_text = f"{job.get('title', '')} {job.get('description', '')}".lower()
-        job_skills = self._extract_skills_from_text(job_text)
+    def _keyword_overlap(self, job: NormalizedJob) -> Tuple[Set[str], Set[str], Set[str]]:
+        """Return (matching, missing, all job skills) from keyword extraction."""
+        job_skills = self._extract_skills_from_lower(job.combined_lower)
         
         # Also check any skills listed in the job
-        if job.get('skills'):
-            for skill in job.get('skills', []):
-                job_skills.add(skill.lower())
+        job_skills.update(job.skills)
         
-        # Find matches
-        matching = self.user_skills.intersection(job_skills)
-        missing = job_skills - self.user_skills
+        # Find matches (both set operations run in C; no per-skill Python loop)
+        matching = job_skills & self.user_skills
+        missing = job_skills - matching
+        
+        return matching, missing, job_skills
+    
+    def _keyword_match(self, job: Union[Dict[str, Any], NormalizedJob], overlap=None) -> Dict[str, Any]:
+        """Fallback keyword-based matching."""
+        matching, missing, job_skills = overlap or self._keyword_overlap(NormalizedJob.from_dict(job))
         
         # Calculate score based on match percentage
         if not job_skills:
@@ -177,52 +292,174 @@ Analyze the match and respond with JSON only:
         
         return {
             'match_score': match_score,
-            'matching_skills': list(matching)[:10],
-            'missing_skills': list(missing)[:10],
+            'matching_skills': list(islice(matching, 10)),
+            'missing_skills': list(islice(missing, 10)),
             'match_summary': f"Matched {len(matching)}/{len(job_skills)} required skills",
         }
     
-    def match_job(self, job: Dict[str, Any]) -> Dict[str, Any]:
+    def match_job(self, job: Union[Dict[str, Any], NormalizedJob]) -> Dict[str, Any]:
         """
         Match a job against user's profile.
         
         Args:
-            job: Job dictionary.
+            job: Job dictionary (or NormalizedJob).
             
         Returns:
             Dictionary with match_score, matching_skills, missing_skills.
         """
-        title = job.get('title', 'Unknown')
-        company = job.get('company', 'Unknown')
-        description = job.get('description', '')[:600]
+        job = NormalizedJob.from_dict(job)
+        overlap = self._keyword_overlap(job)
         
-        # If we have resume text and LLM, use AI matching
-        if self.resume_text and len(self.resume_text) > 100:
-            resume_summary = self.resume_text[:1000]  # Truncate for prompt
+        result, key = self._pre_match(job, overlap)
+        if result is not None:
+            return result
+        
+        return self._llm_match(job, key, overlap)
+    
+    def _llm_match(self, job: NormalizedJob, key: bytes, overlap) -> Dict[str, Any]:
+        """Match one job with the LLM, falling back to the precomputed keyword overlap."""
+        a, b, c, d, e = self._MATCH_PARTS
+        prompt = ''.join((
+            a, self.resume_text[:1000],  # Truncate for prompt
+            b, job.title,
+            c, job.company,
+            d, job.description[:600] or 'No description available',
+            e,
+        ))
+        
+        response = self._call_ollama(prompt, format=self.MATCH_SCHEMA)
+        
+        if response:
+            try:
+                # Schema-constrained output is plain JSON
+                result = self._clean_match_result(orjson.loads(response))
+                self._match_cache.put(key, result)
+                return dict(result)
+            except Exception as e:
+                logger.debug(f"Failed to parse LLM response: {e}")
+        
+        # Fallback to keyword matching
+        return self._keyword_match(job, overlap)
+    
+    def match_job_many(self, jobs: List[Union[Dict[str, Any], NormalizedJob]], batch_size: int = 4) -> List[Dict[str, Any]]:
+        """
+        Match several jobs, sending the resume once per LLM request for up to batch_size jobs.
+        
+        Args:
+            jobs: List of job dictionaries.
+            batch_size: Maximum number of jobs per request.
             
-            prompt = self.MATCH_PROMPT.format(
-                resume_summary=resume_summary,
-                title=title,
-                company=company,
-                description=description or 'No description available'
+        Returns:
+            List of match results, in the same order as jobs.
+        """
+        jobs = [NormalizedJob.from_dict(job) for job in jobs]
+        # One keyword pass per job, shared by the shortcut, the LLM prompt and any fallback
+        overlaps = [self._keyword_overlap(job) for job in jobs]
+        results = [None] * len(jobs)
+        pending = []
+        
+        for i, job in enumerate(jobs):
+            results[i], key = self._pre_match(job, overlaps[i])
+            if results[i] is None:
+                pending.append((i, key))
+        
+        for start in range(0, len(pending), max(1, batch_size)):
+            chunk = pending[start:start + batch_size]
+            batch_results = self._match_batch(
+                [jobs[i] for i, _ in chunk],
+                [key for _, key in chunk],
+                [overlaps[i] for i, _ in chunk],
             )
-            
-            response = self._call_ollama(prompt)
-            
-            if response:
-                try:
-                    # Find JSON in response
-                    json_match = re.search(r'\{[\s\S]*\}', response)
-                    if json_match:
-                        result = json.loads(json_match.group(0))
-                        # Ensure score is in range
-                        result['match_score'] = max(1, min(10, int(result.get('match_score', 5))))
-                        return result
-                except Exception as e:
-                    logger.debug(f"Failed to parse LLM response: {e}")
+            for (i, _), result in zip(chunk, batch_results):
+                results[i] = result
         
-        # Fallback to keyword matching
-        return self._keyword_match(job)
+        return results
+    
+    def _pre_match(self, job: NormalizedJob, overlap) -> Tuple[Optional[Dict[str, Any]], Optional[bytes]]:
+        """
+        Resolve a match without the LLM where possible.
+        
+        Args:
+            job: Normalized job.
+            overlap: The job's _keyword_overlap() result.
+        
+        Returns:
+            (result, None) when no LLM call is needed, otherwise (None, cache key).
+        """
+        # Without a resume there is nothing for the LLM to compare against
+        if not (self.resume_text and len(self.resume_text) > 100):
+            return self._keyword_match(job, overlap), None
+        
+        # Skip the LLM when keyword overlap is already clearly high or clearly zero
+        cutoff = self.config.match_keyword_confidence_cutoff
+        if cutoff:
+            matching, _, job_skills = overlap
+            if len(job_skills) >= 3:
+                match_pct = len(matching) / len(job_skills)
+                if match_pct >= cutoff or match_pct == 0:
+                    result = self._keyword_match(job, overlap)
+                    result['source'] = 'keyword'
+                    return result, None
+        
+        key = content_key(self.model, self.resume_text[:1000], job.title, job.company, job.description[:600])
+        cached = self._match_cache.get(key)
+        if cached is not None:
+            return dict(cached), None
+        
+        return None, key
+    
+    def _match_batch(self, jobs: List[NormalizedJob], keys: List[bytes], overlaps: List[Tuple]) -> List[Dict[str, Any]]:
+        """Match one batch with a single LLM call, falling back to per-job matching."""
+        if len(jobs) == 1:
+            return [self._llm_match(jobs[0], keys[0], overlaps[0])]
+        
+        a, b, c, d, e = self._BATCH_ENTRY_PARTS
+        entries = [
+            ''.join((
+                a, str(i),
+                b, job.title,
+                c, job.company,
+                d, job.description[:600] or 'No description available',
+                e,
+            ))
+            for i, job in enumerate(jobs, 1)
+        ]
+        prompt = self.MATCH_PROMPT_BATCH.format(
+            count=len(jobs),
+            resume_summary=self.resume_text[:1000],
+            jobs='\n\n'.join(entries),
+        )
+        
+        by_id = {}
+        response = self._call_ollama(prompt, format=self.MATCH_BATCH_SCHEMA)
+        if response:
+            try:
+                for item in orjson.loads(response).get('results', []):
+                    try:
+                        by_id[int(item.pop('id'))] = self._clean_match_result(item)
+                    except (AttributeError, KeyError, TypeError, ValueError):
+                        continue
+            except Exception as e:
+                logger.debug(f"Failed to parse batch LLM response: {e}")
+        
+        results = []
+        for i, (job, key, overlap) in enumerate(zip(jobs, keys, overlaps), 1):
+            result = by_id.get(i)
+            if result is None:
+                results.append(self._llm_match(job, key, overlap))
+            else:
+                self._match_cache.put(key, result)
+                results.append(dict(result))
+        
+        return results
+    
+    @staticmethod
+    def _clean_match_result(result: Dict[str, Any]) -> Dict[str, Any]:
+        """Validate an LLM match result and clamp its score to 1-10."""
+        if not isinstance(result, dict):
+            raise TypeError("Match result is not an object")
+        result['match_score'] = max(1, min(10, int(result.get('match_score', 5))))
+        return result
     
     def analyze_resume(self) -> Dict[str, Any]:
         """
@@ -254,20 +491,30 @@ Respond with JSON only:
 }}
 """
         
-        response = self._call_ollama(analysis_prompt)
+        # The raw LLM analysis only depends on the resume and model, so it is
+        # kept on disk and reused until the resume changes
+        key = content_key(self.model, self.resume_text)
+        result = self._analysis_cache.get(key)
         
-        if response:
-            try:
-                json_match = re.search(r'\{[\s\S]*\}', response)
-                if json_match:
-                    result = json.loads(json_match.group(0))
-                    # Merge with extracted skills
-                    all_skills = set(result.get('skills', []))
-                    all_skills.update(self.user_skills)
-                    result['skills'] = list(all_skills)
-                    return result
-            except Exception as e:
-                logger.debug(f"Failed to parse analysis: {e}")
+        if result is None:
+            response = self._call_ollama(analysis_prompt)
+            
+            if response:
+                try:
+                    json_match = re.search(r'\{[\s\S]*\}', response)
+                    if json_match:
+                        result = orjson.loads(json_match.group(0))
+                        self._analysis_cache.put(key, result)
+                except Exception as e:
+                    logger.debug(f"Failed to parse analysis: {e}")
+        
+        if isinstance(result, dict):
+            # Merge with extracted skills
+            result = dict(result)
+            all_skills = set(result.get('skills', []))
+            all_skills.update(self.user_skills)
+            result['skills'] = list(all_skills)
+            return result
         
         # Return keyword-based analysis
         return {
@@ -287,17 +534,21 @@ Respond with JSON only:
         Returns:
             Dictionary of missing skills with frequency counts.
         """
-        skill_gaps = {}
+        skill_gaps = Counter()
+        results = {}
         
         for job in jobs:
-            result = self.match_job(job)
-            for skill in result.get('missing_skills', []):
-                skill_lower = skill.lower()
-                skill_gaps[skill_lower] = skill_gaps.get(skill_lower, 0) + 1
+            job = NormalizedJob.from_dict(job)
+            
+            # Identical postings reuse one match result (and still count once each)
+            key = content_key(job.title, job.company, job.description[:600])
+            result = results.get(key)
+            if result is None:
+                result = results[key] = self.match_job(job)
+            skill_gaps.update(skill.lower() for skill in result.get('missing_skills', []))
         
         # Sort by frequency
-        sorted_gaps = dict(sorted(skill_gaps.items(), key=lambda x: x[1], reverse=True))
-        return sorted_gaps
+        return dict(skill_gaps.most_common())
     
     def add_skill(self, skill: str):
         """Add a skill to user's profile."""
@@ -306,6 +557,11 @@ Respond with JSON only:
     def remove_skill(self, skill: str):
         """Remove a skill from user's profile."""
         self.user_skills.discard(skill.lower())
+    
+    def close(self):
+        """Close the match and resume analysis caches."""
+        self._match_cache.close()
+        self._analysis_cache.close()
 
 
 # For testing
@@ -1,10 +1,14 @@
 
 import os
 import sys
+import queue
+import atexit
 import logging
+import logging.handlers
 import argparse
 from datetime import datetime
-from typing import List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, TYPE_CHECKING
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -12,25 +16,44 @@ load_dotenv()
 
 # Configure logging with UTF-8 encoding
 log_level = os.getenv('LOG_LEVEL', 'INFO')
+log_format = logging.Formatter('%(asctime)s - %(levelname)s - %(name)s - %(message)s')
+
+# The log file is written by a background listener thread, so per-job log
+# calls don't block on disk I/O. Console output stays synchronous so it keeps
+# its order relative to print().
+file_handler = logging.FileHandler('job_alert.log', encoding='utf-8')
+file_handler.setFormatter(log_format)
+log_queue = queue.SimpleQueue()
+log_listener = logging.handlers.QueueListener(log_queue, file_handler)
+log_listener.start()
+atexit.register(log_listener.stop)  # Drains queued records before exit
+
+queue_handler = logging.handlers.QueueHandler(log_queue)
+queue_handler.setFormatter(logging.Formatter('%(message)s'))  # Full format is applied by file_handler
+stream_handler = logging.StreamHandler(sys.stdout)
+stream_handler.setFormatter(log_format)
 logging.basicConfig(
     level=getattr(logging, log_level),
-    format='%(asctime)s - %(levelname)s - %(name)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler('job_alert.log', encoding='utf-8')
-    ]
+    handlers=[stream_handler, queue_handler]
 )
 logger = logging.getLogger(__name__)
 
-# Import project modules
-from scrapers import JobScraperManager
-from storage.local_storage import LocalStorageClient
-from llm.job_scorer import EnhancedJobScorer
-from llm.resume_matcher import ResumeMatcher
-from notifier.emailer import EmailNotifier
-from utils.helpers import deduplicate_jobs, format_job_for_storage
+# Import project modules (scrapers, LLM clients and the emailer are imported
+# where they are first needed, so modes that skip them start faster)
+from utils.helpers import (
+    deduplicate_jobs,
+    fuzzy_key_index,
+    fuzzy_deduplicate_jobs,
+    format_job_for_storage,
+)
 from utils.config import Config
 
+if TYPE_CHECKING:
+    from llm.job_scorer import EnhancedJobScorer
+    from llm.resume_matcher import ResumeMatcher
+    from notifier.emailer import EmailNotifier
+    from storage.local_storage import LocalStorageClient
+
 
 def print_banner():
     """Print application banner."""
@@ -51,21 +74,10 @@ def print_banner():
     print(banner)
 
 
-def scrape_all_sources(config: Config) -> List[Dict[str, Any]]:
-    """
-    Scrape jobs from all configured sources.
-    
-    Returns:
-        List of job dictionaries with standardized fields.
-    """
-    scraper_manager = JobScraperManager(config)
-    return scraper_manager.scrape_all()
-
-
 def process_jobs_with_ai(
     jobs: List[Dict[str, Any]], 
-    scorer: EnhancedJobScorer,
-    resume_matcher: ResumeMatcher,
+    scorer: 'EnhancedJobScorer',
+    resume_matcher: 'ResumeMatcher',
     config: Config
 ) -> List[Dict[str, Any]]:
     """
@@ -78,24 +90,54 @@ def process_jobs_with_ai(
         config: Configuration object
         
     Returns:
-        List of scored and matched jobs
+        List of scored and matched jobs, in input order (main sorts once
+        across all sources)
     """
+    from llm.normalized_job import NormalizedJob
+    
     processed_jobs = []
     total = len(jobs)
     
-    for i, job in enumerate(jobs):
+    # Slotted views of the jobs, built once and shared by the scorer and the
+    # matcher (each would otherwise re-read and re-lowercase every dict)
+    normalized = [NormalizedJob.from_dict(job) for job in jobs]
+    
+    # Step 1: AI Relevance Scores (is this an AI/ML job?), several jobs per LLM request
+    try:
+        relevance_scores = scorer.score_relevance_many(normalized)
+    except Exception as e:
+        logger.error("Batch scoring failed, scoring jobs individually: %s", e)
+        relevance_scores = [None] * total
+    
+    relevant = []
+    for i, (job, relevance_score) in enumerate(zip(jobs, relevance_scores)):
         try:
-            logger.info(f"Processing job {i+1}/{total}: {job.get('title', 'Unknown')[:50]}...")
+            logger.info("Processing job %d/%d: %.50s...", i + 1, total, normalized[i].title)
             
-            # Step 1: AI Relevance Score (is this an AI/ML job?)
-            relevance_score = scorer.score_relevance(job)
+            if relevance_score is None:
+                relevance_score = scorer.score_relevance(normalized[i])
             
             if relevance_score < config.min_relevance_score:
-                logger.debug(f"  → Relevance: {relevance_score}/10 (SKIP - below threshold)")
+                logger.debug("  → Relevance: %s/10 (SKIP - below threshold)", relevance_score)
                 continue
             
-            # Step 2: Resume Match Score (how well does it match your profile?)
-            match_result = resume_matcher.match_job(job)
+            relevant.append((i, relevance_score))
+        except Exception as e:
+            logger.error("Error processing job: %s", e)
+            _keyword_fallback(job, processed_jobs)
+    
+    # Step 2: Resume Match Scores (how well does it match your profile?), batched the same way
+    try:
+        match_results = resume_matcher.match_job_many([normalized[i] for i, _ in relevant])
+    except Exception as e:
+        logger.error("Batch matching failed, matching jobs individually: %s", e)
+        match_results = [None] * len(relevant)
+    
+    for (i, relevance_score), match_result in zip(relevant, match_results):
+        job = jobs[i]
+        try:
+            if match_result is None:
+                match_result = resume_matcher.match_job(normalized[i])
             match_score = match_result.get('match_score', 0)
             matching_skills = match_result.get('matching_skills', [])
             missing_skills = match_result.get('missing_skills', [])
@@ -104,40 +146,48 @@ def process_jobs_with_ai(
             combined_score = (relevance_score * 0.4) + (match_score * 0.6)
             
             # Add scores to job
-            job['relevance_score'] = relevance_score
-            job['match_score'] = match_score
-            job['combined_score'] = round(combined_score, 1)
-            job['matching_skills'] = matching_skills
-            job['missing_skills'] = missing_skills
-            job['ai_score'] = round(combined_score)  # For backward compatibility
+            job.update(
+                relevance_score=relevance_score,
+                match_score=match_score,
+                combined_score=round(combined_score, 1),
+                matching_skills=matching_skills,
+                missing_skills=missing_skills,
+                ai_score=round(combined_score),  # For backward compatibility
+            )
             
-            logger.info(f"  → Relevance: {relevance_score}/10, Match: {match_score}/10, Combined: {combined_score:.1f}/10")
+            logger.info(
+                "  → %.50s: Relevance: %s/10, Match: %s/10, Combined: %.1f/10",
+                normalized[i].title, relevance_score, match_score, combined_score,
+            )
             
             if combined_score >= config.min_combined_score:
                 processed_jobs.append(job)
-                logger.info(f"  → ACCEPTED ✓")
+                logger.info("  → ACCEPTED ✓")
             else:
-                logger.info(f"  → REJECTED (combined score below {config.min_combined_score})")
+                logger.info("  → REJECTED (combined score below %s)", config.min_combined_score)
                 
         except Exception as e:
-            logger.error(f"Error processing job: {e}")
-            # Fallback: use keyword-based scoring
-            if any(kw in job.get('title', '').lower() for kw in ['machine learning', 'ai ', 'ml ', 'data scientist']):
-                job['relevance_score'] = 7
-                job['match_score'] = 5
-                job['combined_score'] = 6
-                job['ai_score'] = 6
-                job['matching_skills'] = []
-                job['missing_skills'] = []
-                processed_jobs.append(job)
-    
-    # Sort by combined score
-    processed_jobs.sort(key=lambda x: x.get('combined_score', 0), reverse=True)
+            logger.error("Error processing job: %s", e)
+            _keyword_fallback(job, processed_jobs)
     
-    logger.info(f"Jobs passing AI filter: {len(processed_jobs)}/{total}")
+    logger.info("Jobs passing AI filter: %d/%d", len(processed_jobs), total)
     return processed_jobs
 
 
+def _keyword_fallback(job: Dict[str, Any], processed_jobs: List[Dict[str, Any]]):
+    """Keep an obviously relevant job with default scores when AI processing fails."""
+    if any(kw in job.get('title', '').lower() for kw in ['machine learning', 'ai ', 'ml ', 'data scientist']):
+        job.update(
+            relevance_score=7,
+            match_score=5,
+            combined_score=6,
+            ai_score=6,
+            matching_skills=[],
+            missing_skills=[],
+        )
+        processed_jobs.append(job)
+
+
 def main(args=None):
     """
     Main execution flow.
@@ -147,32 +197,53 @@ def main(args=None):
     parser.add_argument('--test', action='store_true', help='Run in test mode (limit jobs)')
     parser.add_argument('--sources', nargs='+', help='Specific sources to scrape')
     parser.add_argument('--analyze-resume', action='store_true', help='Only analyze resume')
+    parser.add_argument('--no-cache', action='store_true', help='Ignore cached LLM results from earlier runs')
+    parser.add_argument('--workers', type=int, help='Number of sources scraped concurrently')
+    parser.add_argument('--rate-limit', type=float, metavar='RPS', help='Max requests per second to any one host')
     args = parser.parse_args(args)
     
     print_banner()
     
     logger.info("=" * 60)
     logger.info("Starting AI/ML Job Alert System - Enhanced Edition")
-    logger.info(f"Run time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    logger.info("Run time: %s", datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
     logger.info("=" * 60)
     
     # Load configuration
     config = Config()
+    if args.no_cache:
+        config.llm_cache = False
+    if args.workers:
+        config.scraper_workers = args.workers
+    if args.rate_limit is not None:
+        config.request_rate_limit = args.rate_limit
     
     # Initialize components
     try:
+        from storage.local_storage import LocalStorageClient
+        from llm.resume_matcher import ResumeMatcher
+        
         storage_client = LocalStorageClient(config.data_dir)
-        scorer = EnhancedJobScorer(config)
         resume_matcher = ResumeMatcher(config)
-        emailer = EmailNotifier() if not args.no_email else None
+        
+        # Resume analysis needs neither the scorer nor email
+        scorer = emailer = None
+        if not args.analyze_resume:
+            from llm.job_scorer import EnhancedJobScorer
+            scorer = EnhancedJobScorer(config)
+            
+            if not args.no_email:
+                from notifier.emailer import EmailNotifier
+                emailer = EmailNotifier()
     except Exception as e:
-        logger.error(f"Failed to initialize components: {e}")
+        logger.error("Failed to initialize components: %s", e)
         sys.exit(1)
     
     # If only analyzing resume
     if args.analyze_resume:
         logger.info("\n[RESUME ANALYSIS MODE]")
         analysis = resume_matcher.analyze_resume()
+        resume_matcher.close()
         print("\n" + "=" * 60)
         print("RESUME ANALYSIS RESULTS")
         print("=" * 60)
@@ -183,31 +254,84 @@ def main(args=None):
         print(f"Primary Domain: {analysis.get('domain', 'Unknown')}")
         return
     
-    # Step 1: Scrape all job sources
-    logger.info("\n[STEP 1] Scraping job sources...")
+    try:
+        run_pipeline(args, config, storage_client, scorer, resume_matcher, emailer)
+    finally:
+        # Release the scorer's request threads and the cache connections
+        scorer.close()
+        resume_matcher.close()
+
+
+def run_pipeline(
+    args: argparse.Namespace,
+    config: Config,
+    storage_client: 'LocalStorageClient',
+    scorer: 'EnhancedJobScorer',
+    resume_matcher: 'ResumeMatcher',
+    emailer: 'EmailNotifier' = None
+):
+    """
+    Scrape, deduplicate, score, store and notify (steps 1-5).
+    
+    Args:
+        args: Parsed command-line arguments
+        config: Configuration object
+        storage_client: LocalStorageClient instance
+        scorer: EnhancedJobScorer instance
+        resume_matcher: ResumeMatcher instance
+        emailer: EmailNotifier instance, or None to skip email
+    """
+    # Steps 1-3 are pipelined: each source's jobs are deduplicated and scored
+    # as soon as that source finishes, while slower sources keep scraping
+    logger.info("\n[STEP 1-3] Scraping, deduplicating and AI processing (per source as it completes)...")
     if args.sources:
         config.enabled_sources = args.sources
     
-    scraped_jobs = scrape_all_sources(config)
+    try:
+        # Stored keys are already normalized; each source's kept jobs are added as it is processed
+        existing_keys = storage_client.get_existing_keys()
+    except Exception as e:
+        logger.error("Error loading existing jobs: %s", e)
+        existing_keys = set()
     
-    if args.test:
-        scraped_jobs = scraped_jobs[:10]  # Limit for testing
+    existing_fuzzy_index = fuzzy_key_index(key.split('|', 1) for key in existing_keys)
+    
+    from scrapers import JobScraperManager
+    scraper_manager = JobScraperManager(config)
+    scraped_count = 0
+    new_jobs = []
+    qualified_jobs = []
+    
+    for source_jobs in scraper_manager.iter_scrape_all():
+        if args.test:
+            source_jobs = source_jobs[:max(0, 10 - scraped_count)]  # Limit for testing
+        if not source_jobs:
+            continue
+        scraped_count += len(source_jobs)
+        
+        # Deduplicate against existing data
+        try:
+            source_new = deduplicate_jobs(source_jobs, [], seen_keys=existing_keys)
+            # Near-duplicates of stored jobs or of jobs from earlier sources this run
+            source_new = fuzzy_deduplicate_jobs(source_new, index=existing_fuzzy_index)
+        except Exception as e:
+            logger.error("Error during deduplication: %s", e)
+            source_new = source_jobs
+        new_jobs.extend(source_new)
+        
+        # AI Processing (Scoring + Resume Matching)
+        if source_new:
+            qualified_jobs.extend(process_jobs_with_ai(source_new, scorer, resume_matcher, config))
+        
+        if args.test and scraped_count >= 10:
+            break
     
-    if not scraped_jobs:
+    if not scraped_count:
         logger.warning("No jobs scraped. Exiting.")
         return
     
-    logger.info(f"Total jobs scraped: {len(scraped_jobs)}")
-    
-    # Step 2: Deduplicate against existing data
-    logger.info("\n[STEP 2] Deduplicating jobs...")
-    try:
-        existing_jobs = storage_client.get_existing_jobs()
-        new_jobs = deduplicate_jobs(scraped_jobs, existing_jobs)
-        logger.info(f"New unique jobs after deduplication: {len(new_jobs)}")
-    except Exception as e:
-        logger.error(f"Error during deduplication: {e}")
-        new_jobs = scraped_jobs
+    logger.info("Total jobs scraped: %d", scraped_count)
+    logger.info("New unique jobs after deduplication: %d", len(new_jobs))
     
     if not new_jobs:
         logger.info("No new jobs to process.")
@@ -218,9 +342,8 @@ def main(args=None):
                 pass
         return
     
-    # Step 3: AI Processing (Scoring + Resume Matching)
-    logger.info("\n[STEP 3] AI Processing (Scoring + Resume Matching)...")
-    qualified_jobs = process_jobs_with_ai(new_jobs, scorer, resume_matcher, config)
+    # Sort by combined score across all sources
+    qualified_jobs.sort(key=lambda x: x.get('combined_score', 0), reverse=True)
     
     if not qualified_jobs:
         logger.info("No jobs passed AI filter.")
@@ -234,39 +357,35 @@ def main(args=None):
     # Step 4: Store in local storage
     logger.info("\n[STEP 4] Storing qualified jobs...")
     stored_count = 0
-    for job in qualified_jobs:
-        try:
-            row_data = format_job_for_storage(job)
-            if storage_client.append_job(row_data, job):
-                stored_count += 1
-                logger.info(f"Stored: {job.get('title')[:40]}... (Score: {job.get('combined_score', 0)})")
-        except Exception as e:
-            logger.error(f"Error storing job: {e}")
+    stored_flags = storage_client.append_jobs([(format_job_for_storage(job), job) for job in qualified_jobs])
+    for job, stored in zip(qualified_jobs, stored_flags):
+        if stored:
+            stored_count += 1
+            logger.info("Stored: %.40s... (Score: %s)", job.get('title'), job.get('combined_score', 0))
     
-    logger.info(f"Successfully stored {stored_count} jobs")
+    logger.info("Successfully stored %d jobs", stored_count)
     
     # Get stats
     stats = storage_client.get_stats()
-    logger.info(f"Data saved to: {storage_client.csv_file}")
+    logger.info("Data saved to: %s", storage_client.csv_file)
     
-    # Step 5: Send email notification
+    # Step 5: Send email notification (in the background, so the SMTP
+    # handshake overlaps with the summary below)
+    email_executor = None
     if emailer:
         logger.info("\n[STEP 5] Sending email notification...")
-        try:
-            emailer.send_notification(qualified_jobs, stored_count, stats)
-            logger.info("Email notification sent successfully")
-        except Exception as e:
-            logger.error(f"Error sending email: {e}")
+        email_executor = ThreadPoolExecutor(max_workers=1)
+        email_future = email_executor.submit(emailer.send_notification, qualified_jobs, stored_count, stats)
     
     # Summary
     logger.info("\n" + "=" * 60)
     logger.info("JOB ALERT RUN COMPLETE")
     logger.info("=" * 60)
-    logger.info(f"Total scraped: {len(scraped_jobs)}")
-    logger.info(f"New unique jobs: {len(new_jobs)}")
-    logger.info(f"Passed AI filter: {len(qualified_jobs)}")
-    logger.info(f"Stored: {stored_count}")
-    logger.info(f"Total in database: {stats.get('total_jobs', 0)}")
+    logger.info("Total scraped: %d", scraped_count)
+    logger.info("New unique jobs: %d", len(new_jobs))
+    logger.info("Passed AI filter: %d", len(qualified_jobs))
+    logger.info("Stored: %d", stored_count)
+    logger.info("Total in database: %s", stats.get('total_jobs', 0))
     logger.info("=" * 60)
     
     # Print top jobs
@@ -281,6 +400,15 @@ def main(args=None):
             print(f"   Matching Skills: {', '.join(job.get('matching_skills', [])[:5]) or 'N/A'}")
             if job.get('salary'):
                 print(f"   Salary: {job.get('salary')}")
+    
+    if email_executor:
+        try:
+            email_future.result()
+            logger.info("Email notification sent successfully")
+        except Exception as e:
+            logger.error("Error sending email: %s", e)
+        finally:
+            email_executor.shutdown(wait=True)
 
 
 if __name__ == "__main__":
@@ -2,6 +2,7 @@
 import os
 import ssl
 import logging
+import heapq
 import smtplib
 from datetime import datetime
 from email.mime.text import MIMEText
@@ -10,40 +11,8 @@ from typing import List, Dict, Any
 
 logger = logging.getLogger(__name__)
 
-
-class EmailNotifier:
-    """
-    Sends email notifications via Gmail SMTP.
-    Enhanced with match scores and skill analysis.
-    """
-    
-    SMTP_SERVER = "smtp.gmail.com"
-    SMTP_PORT = 465
-    
-    def __init__(self):
-        """Initialize email notifier."""
-        self.sender_email = os.getenv('GMAIL_ADDRESS')
-        self.sender_password = os.getenv('GMAIL_APP_PASSWORD')
-        self.recipient_email = os.getenv('NOTIFICATION_EMAIL') or self.sender_email
-        
-        if not self.sender_email:
-            raise ValueError("GMAIL_ADDRESS not set")
-        if not self.sender_password:
-            raise ValueError("GMAIL_APP_PASSWORD not set")
-        
-        logger.info(f"Email notifier initialized for: {self.recipient_email}")
-    
-    def _generate_html(self, jobs: List[Dict], stored_count: int, stats: Dict) -> str:
-        """Generate enhanced HTML email content."""
-        today = datetime.now().strftime('%B %d, %Y')
-        sorted_jobs = sorted(jobs, key=lambda x: x.get('combined_score', 0), reverse=True)
-        top_jobs = sorted_jobs[:10]
-        
-        # Calculate stats
-        avg_match = sum(j.get('match_score', 0) for j in jobs) / len(jobs) if jobs else 0
-        top_score = max((j.get('combined_score', 0) for j in jobs), default=0)
-        
-        html = f"""
+# Email templates (str.format placeholders; literal braces are doubled)
+HEADER_HTML = """
 <!DOCTYPE html>
 <html>
 <head>
@@ -182,7 +151,7 @@ class EmailNotifier:
                 <div class="stat-label">New Jobs</div>
             </div>
             <div class="stat-box">
-                <div class="stat-number">{len(jobs)}</div>
+                <div class="stat-number">{qualified}</div>
                 <div class="stat-label">Qualified</div>
             </div>
             <div class="stat-box">
@@ -195,23 +164,14 @@ class EmailNotifier:
             </div>
         </div>
 """
-        
-        if top_jobs:
-            html += '<h2 style="font-size: 18px; margin-bottom: 15px;">🏆 Top Matched Jobs</h2>'
-            
-            for job in top_jobs:
-                match_score = job.get('match_score', 0)
-                relevance_score = job.get('relevance_score', 0)
-                combined = job.get('combined_score', 0)
-                
-                matching_skills = job.get('matching_skills', [])[:4]
-                missing_skills = job.get('missing_skills', [])[:3]
-                
-                html += f"""
+
+TOP_JOBS_HEADING_HTML = '<h2 style="font-size: 18px; margin-bottom: 15px;">🏆 Top Matched Jobs</h2>'
+
+JOB_CARD_HTML = """
         <div class="job-card">
             <div class="job-header">
-                <a href="{job.get('link', '#')}" class="job-title" target="_blank">
-                    {job.get('title', 'Unknown')}
+                <a href="{link}" class="job-title" target="_blank">
+                    {title}
                 </a>
                 <div class="score-badges">
                     <span class="badge badge-match">Match: {match_score}/10</span>
@@ -219,77 +179,168 @@ class EmailNotifier:
                 </div>
             </div>
             <div class="job-meta">
-                <span>🏢 {job.get('company', 'Unknown')}</span>
-                <span>📍 {job.get('location', 'Remote')}</span>
-                <span>📊 {job.get('source', 'Unknown')}</span>
-                {f"<span>💰 {job.get('salary')}</span>" if job.get('salary') else ""}
+                <span>🏢 {company}</span>
+                <span>📍 {location}</span>
+                <span>📊 {source}</span>
+                {salary}
             </div>
             <div class="skills-section">
-                {f'<span class="skills-match">✓ {", ".join(matching_skills)}</span>' if matching_skills else ''}
-                {f' &nbsp;|&nbsp; <span class="skills-missing">Need: {", ".join(missing_skills)}</span>' if missing_skills else ''}
+                {matching_skills}
+                {missing_skills}
             </div>
         </div>
 """
-        else:
-            html += """
+
+NO_JOBS_HTML = """
         <div class="no-jobs">
             <p>No matching jobs found today.</p>
             <p>We'll keep looking! Try expanding your skills in your resume.</p>
         </div>
 """
-        
-        # Add source breakdown if available
-        if stats.get('sources'):
-            html += '<h3 style="font-size: 14px; margin-top: 25px;">📊 Jobs by Source</h3><p style="font-size: 13px; color: #666;">'
-            for source, count in sorted(stats['sources'].items(), key=lambda x: x[1], reverse=True)[:5]:
-                html += f'{source}: {count} • '
-            html = html.rstrip(' • ') + '</p>'
-        
-        html += f"""
+
+SOURCES_HTML = '<h3 style="font-size: 14px; margin-top: 25px;">📊 Jobs by Source</h3><p style="font-size: 13px; color: #666;">{sources}</p>'
+
+FOOTER_HTML = """
         <div class="footer">
             <p>AI/ML Job Alert System v2.0 - Enhanced with Resume Matching</p>
-            <p>Total jobs in database: {stats.get('total_jobs', 0)}</p>
-            <p>Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
+            <p>Total jobs in database: {total_jobs}</p>
+            <p>Generated: {generated}</p>
         </div>
     </div>
 </body>
 </html>
 """
-        return html
-    
-    def _generate_text(self, jobs: List[Dict], stored_count: int, stats: Dict) -> str:
-        """Generate plain text email content."""
-        today = datetime.now().strftime('%B %d, %Y')
-        sorted_jobs = sorted(jobs, key=lambda x: x.get('combined_score', 0), reverse=True)
-        
-        text = f"""
+
+HEADER_TEXT = """
 AI/ML Job Alert - {today}
-{'=' * 50}
+{rule}
 
 SUMMARY
 -------
 • New Jobs Found: {stored_count}
-• Qualified Jobs: {len(jobs)}
-• Total in Database: {stats.get('total_jobs', 0)}
+• Qualified Jobs: {qualified}
+• Total in Database: {total_jobs}
+
+"""
+
+JOB_ENTRY_TEXT = """{index}. {title}
+   Company: {company}
+   Location: {location}
+   Match Score: {match_score}/10
+   Relevance: {relevance_score}/10
+   Link: {link}
 
 """
+
+
+class EmailNotifier:
+    """
+    Sends email notifications via Gmail SMTP.
+    Enhanced with match scores and skill analysis.
+    """
+    
+    SMTP_SERVER = "smtp.gmail.com"
+    SMTP_PORT = 465
+    
+    def __init__(self):
+        """Initialize email notifier."""
+        self.sender_email = os.getenv('GMAIL_ADDRESS')
+        self.sender_password = os.getenv('GMAIL_APP_PASSWORD')
+        self.recipient_email = os.getenv('NOTIFICATION_EMAIL') or self.sender_email
+        
+        if not self.sender_email:
+            raise ValueError("GMAIL_ADDRESS not set")
+        if not self.sender_password:
+            raise ValueError("GMAIL_APP_PASSWORD not set")
+        
+        logger.info(f"Email notifier initialized for: {self.recipient_email}")
+    
+    def _generate_html(self, jobs: List[Dict], stored_count: int, stats: Dict) -> str:
+        """Generate enhanced HTML email content."""
+        today = datetime.now().strftime('%B %d, %Y')
+        # Only the top 10 are shown: partial selection instead of sorting every job
+        top_jobs = heapq.nlargest(10, jobs, key=lambda x: x.get('combined_score', 0))
+        
+        # Calculate stats
+        avg_match = sum(j.get('match_score', 0) for j in jobs) / len(jobs) if jobs else 0
+        top_score = max((j.get('combined_score', 0) for j in jobs), default=0)
+        
+        # Collect segments and join once (repeated += copies the whole document each time)
+        parts = [HEADER_HTML.format(
+            today=today,
+            stored_count=stored_count,
+            qualified=len(jobs),
+            avg_match=avg_match,
+            top_score=top_score,
+        )]
+        
+        if top_jobs:
+            parts.append(TOP_JOBS_HEADING_HTML)
+            
+            for job in top_jobs:
+                matching_skills = job.get('matching_skills', [])[:4]
+                missing_skills = job.get('missing_skills', [])[:3]
+                
+                parts.append(JOB_CARD_HTML.format(
+                    link=job.get('link', '#'),
+                    title=job.get('title', 'Unknown'),
+                    match_score=job.get('match_score', 0),
+                    relevance_score=job.get('relevance_score', 0),
+                    company=job.get('company', 'Unknown'),
+                    location=job.get('location', 'Remote'),
+                    source=job.get('source', 'Unknown'),
+                    salary=f"<span>💰 {job.get('salary')}</span>" if job.get('salary') else "",
+                    matching_skills=f'<span class="skills-match">✓ {", ".join(matching_skills)}</span>' if matching_skills else '',
+                    missing_skills=f' &nbsp;|&nbsp; <span class="skills-missing">Need: {", ".join(missing_skills)}</span>' if missing_skills else '',
+                ))
+        else:
+            parts.append(NO_JOBS_HTML)
+        
+        # Add source breakdown if available
+        if stats.get('sources'):
+            top_sources = sorted(stats['sources'].items(), key=lambda x: x[1], reverse=True)[:5]
+            parts.append(SOURCES_HTML.format(
+                sources=' • '.join(f'{source}: {count}' for source, count in top_sources)
+            ))
+        
+        parts.append(FOOTER_HTML.format(
+            total_jobs=stats.get('total_jobs', 0),
+            generated=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        ))
+        return ''.join(parts)
+    
+    def _generate_text(self, jobs: List[Dict], stored_count: int, stats: Dict) -> str:
+        """Generate plain text email content."""
+        today = datetime.now().strftime('%B %d, %Y')
+        top_jobs = heapq.nlargest(10, jobs, key=lambda x: x.get('combined_score', 0))
+        
+        parts = [HEADER_TEXT.format(
+            today=today,
+            rule='=' * 50,
+            stored_count=stored_count,
+            qualified=len(jobs),
+            total_jobs=stats.get('total_jobs', 0),
+        )]
         
         if jobs:
-            text += "TOP MATCHED JOBS\n"
-            text += "-" * 50 + "\n\n"
+            parts.append("TOP MATCHED JOBS\n")
+            parts.append("-" * 50 + "\n\n")
             
-            for i, job in enumerate(sorted_jobs[:10], 1):
-                text += f"{i}. {job.get('title', 'Unknown')}\n"
-                text += f"   Company: {job.get('company', 'Unknown')}\n"
-                text += f"   Location: {job.get('location', 'Remote')}\n"
-                text += f"   Match Score: {job.get('match_score', 0)}/10\n"
-                text += f"   Relevance: {job.get('relevance_score', 0)}/10\n"
-                text += f"   Link: {job.get('link', 'N/A')}\n\n"
+            for i, job in enumerate(top_jobs, 1):
+                parts.append(JOB_ENTRY_TEXT.format(
+                    index=i,
+                    title=job.get('title', 'Unknown'),
+                    company=job.get('company', 'Unknown'),
+                    location=job.get('location', 'Remote'),
+                    match_score=job.get('match_score', 0),
+                    relevance_score=job.get('relevance_score', 0),
+                    link=job.get('link', 'N/A'),
+                ))
         
-        text += f"\n{'=' * 50}\n"
-        text += f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+        parts.append(f"\n{'=' * 50}\n")
+        parts.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
         
-        return text
+        return ''.join(parts)
     
     def send_notification(self, jobs: List[Dict], stored_count: int, stats: Dict = None) -> bool:
         """Send email notification."""
@@ -1,44 +1,34 @@
 
 
 import logging
-from typing import List, Dict, Any
+import importlib
+from typing import List, Dict, Any, Iterator, Type
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
-from .remoteok import RemoteOKScraper
-from .jobicy import JobicyScraper
-from .arbeitnow import ArbeitnowScraper
-from .findwork import FindworkScraper
-from .himalayas import HimalayasScraper
-from .ycombinator import YCombinatorScraper
-from .hackernews import HackerNewsScraper
-from .github import GitHubJobsScraper
-from .stackoverflow import StackOverflowScraper
-from .linkedin import LinkedInScraper
-from .indeed import IndeedScraper
-from .builtin import BuiltInScraper
+from utils.helpers import _normalize_job_key
 
 logger = logging.getLogger(__name__)
 
-
 class JobScraperManager:
     """
     Manages all job scrapers and coordinates scraping across multiple sources.
     """
     
-    # Map of source names to scraper classes
+    # Map of source names to scraper classes ('module:Class', imported on first use
+    # so only enabled sources pay for their imports)
     SCRAPER_CLASSES = {
-        'remoteok': RemoteOKScraper,
-        'jobicy': JobicyScraper,
-        'arbeitnow': ArbeitnowScraper,
-        'findwork': FindworkScraper,
-        'himalayas': HimalayasScraper,
-        'ycombinator': YCombinatorScraper,
-        'hackernews': HackerNewsScraper,
-        'github': GitHubJobsScraper,
-        'stackoverflow': StackOverflowScraper,
-        'linkedin': LinkedInScraper,
-        'indeed': IndeedScraper,
-        'builtin': BuiltInScraper,
+        'remoteok': 'remoteok:RemoteOKScraper',
+        'jobicy': 'jobicy:JobicyScraper',
+        'arbeitnow': 'arbeitnow:ArbeitnowScraper',
+        'findwork': 'findwork:FindworkScraper',
+        'himalayas': 'himalayas:HimalayasScraper',
+        'ycombinator': 'ycombinator:YCombinatorScraper',
+        'hackernews': 'hackernews:HackerNewsScraper',
+        'github': 'github:GitHubJobsScraper',
+        'stackoverflow': 'stackoverflow:StackOverflowScraper',
+        'linkedin': 'linkedin:LinkedInScraper',
+        'indeed': 'indeed:IndeedScraper',
+        'builtin': 'builtin:BuiltInScraper',
     }
     
     def __init__(self, config):
@@ -56,13 +46,28 @@ class JobScraperManager:
             source_name = source_name.lower()
             if source_name in self.SCRAPER_CLASSES:
                 try:
-                    self.scrapers[source_name] = self.SCRAPER_CLASSES[source_name](config)
+                    self.scrapers[source_name] = self.load_scraper_class(source_name)(config)
                     logger.debug(f"Initialized scraper: {source_name}")
                 except Exception as e:
                     logger.warning(f"Failed to initialize {source_name} scraper: {e}")
         
         logger.info(f"Initialized {len(self.scrapers)} job scrapers")
     
+    @classmethod
+    def load_scraper_class(cls, source_name: str) -> Type:
+        """
+        Import and return the scraper class for a source.
+        
+        Args:
+            source_name: Key in SCRAPER_CLASSES.
+            
+        Returns:
+            The scraper class.
+        """
+        module_name, class_name = cls.SCRAPER_CLASSES[source_name].split(':')
+        module = importlib.import_module(f'.{module_name}', __name__)
+        return getattr(module, class_name)
+    
     def scrape_source(self, source_name: str) -> List[Dict[str, Any]]:
         """
         Scrape jobs from a single source.
@@ -79,6 +84,7 @@ class JobScraperManager:
         
         try:
             scraper = self.scrapers[source_name]
+            scraper.start_batch()
             jobs = scraper.scrape(max_jobs=self.config.max_jobs_per_source)
             logger.info(f"  {source_name}: Found {len(jobs)} jobs")
             return jobs
@@ -86,10 +92,14 @@ class JobScraperManager:
             logger.error(f"  {source_name}: Error - {e}")
             return []
     
-    def scrape_all(self, parallel: bool = False) -> List[Dict[str, Any]]:
+    def scrape_all(self, parallel: bool = True) -> List[Dict[str, Any]]:
         """
         Scrape jobs from all enabled sources.
         
+        Sources are scraped concurrently by default: each one is a separate
+        host with its own session and delays, so total time is roughly that
+        of the slowest source instead of the sum of all of them.
+        
         Args:
             parallel: If True, scrape sources in parallel.
             
@@ -97,13 +107,34 @@ class JobScraperManager:
             Aggregated list of jobs from all sources.
         """
         all_jobs = []
+        for jobs in self.iter_scrape_all(parallel):
+            all_jobs.extend(jobs)
+        
+        logger.info(f"Total unique jobs collected: {len(all_jobs)}")
+        return all_jobs
+    
+    def iter_scrape_all(self, parallel: bool = True) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Scrape all enabled sources, yielding each source's jobs as soon as it finishes.
+        
+        Lets callers start processing fast sources while slow ones are still
+        running. Jobs already yielded for an earlier source are dropped.
+        
+        Args:
+            parallel: If True, scrape sources in parallel.
+            
+        Yields:
+            List of new unique jobs from one source.
+        """
         seen_keys = set()
         
         logger.info(f"Scraping {len(self.scrapers)} sources...")
         
         if parallel and len(self.scrapers) > 1:
             # Parallel scraping
-            with ThreadPoolExecutor(max_workers=5) as executor:
+            max_workers = max(1, min(self.config.scraper_workers, len(self.scrapers)))
+            executor = ThreadPoolExecutor(max_workers=max_workers)
+            try:
                 future_to_source = {
                     executor.submit(self.scrape_source, source): source
                     for source in self.scrapers.keys()
@@ -113,34 +144,32 @@ class JobScraperManager:
                     source = future_to_source[future]
                     try:
                         jobs = future.result()
-                        for job in jobs:
-                            key = self._job_key(job)
-                            if key not in seen_keys:
-                                seen_keys.add(key)
-                                all_jobs.append(job)
                     except Exception as e:
                         logger.error(f"  {source}: Failed - {e}")
+                        continue
+                    yield self._unique(jobs, seen_keys)
+            finally:
+                # Consumer stopped early (or finished): don't start remaining sources
+                executor.shutdown(wait=True, cancel_futures=True)
         else:
             # Sequential scraping
             for source_name in self.scrapers.keys():
-                jobs = self.scrape_source(source_name)
-                for job in jobs:
-                    key = self._job_key(job)
-                    if key not in seen_keys:
-                        seen_keys.add(key)
-                        all_jobs.append(job)
-        
-        logger.info(f"Total unique jobs collected: {len(all_jobs)}")
-        return all_jobs
+                yield self._unique(self.scrape_source(source_name), seen_keys)
+    
+    def _unique(self, jobs: List[Dict[str, Any]], seen_keys: set) -> List[Dict[str, Any]]:
+        """Return jobs whose key has not been seen yet, recording their keys."""
+        unique = []
+        for job in jobs:
+            key = self._job_key(job)
+            if key not in seen_keys:
+                seen_keys.add(key)
+                unique.append(job)
+        return unique
     
     def _job_key(self, job: Dict[str, Any]) -> str:
         """Generate unique key for job deduplication."""
-        title = job.get('title', '').lower().strip()
-        company = job.get('company', '').lower().strip()
-        # Normalize
-        title = ''.join(c for c in title if c.isalnum() or c.isspace())
-        company = ''.join(c for c in company if c.isalnum() or c.isspace())
-        return f"{title}|{company}"
+        # Same normalized key as main's deduplicate_jobs and storage
+        return _normalize_job_key(job.get('title', ''), job.get('company', ''))
     
     def get_available_sources(self) -> List[str]:
         """Get list of all available scraper sources."""
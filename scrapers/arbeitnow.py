@@ -26,7 +26,7 @@ class ArbeitnowScraper(BaseScraper):
             return jobs
         
         try:
-            data = response.json()
+            data = self._parse_json(response)
             job_list = data.get('data', [])
             
             for item in job_list:
@@ -1,15 +1,85 @@
 
+import re
 import time
 import random
 import logging
+import itertools
+import threading
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
+from urllib.parse import urlsplit
 
+import orjson
+import lxml.html
 import requests
+from lxml import etree
+from requests.adapters import HTTPAdapter
+from requests.utils import DEFAULT_ACCEPT_ENCODING
 
 logger = logging.getLogger(__name__)
 
+# Earliest start time of the next request to each host, shared by all scrapers
+_host_next_request: Dict[str, float] = {}
+_host_lock = threading.Lock()
+
+# Requests in flight at once across all scrapers (sources scrape in parallel)
+MAX_CONCURRENT_REQUESTS = 16
+_request_slots = threading.BoundedSemaphore(MAX_CONCURRENT_REQUESTS)
+
+# Longest a server's rate-limit hint may hold back a host (seconds)
+MAX_RATE_LIMIT_WAIT = 30.0
+
+# Round-robin position in USER_AGENTS, advanced once per scraper instance
+_user_agent_index = itertools.count()
+
+# Transient HTTP statuses worth retrying
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# AI_ML_KEYWORDS per scraper class, minus keywords containing another keyword
+_SCAN_KEYWORDS: Dict[type, tuple] = {}
+
+
+@lru_cache(maxsize=4096)
+def _title_has_keyword(keywords: tuple, title: str) -> bool:
+    """Whether the title alone matches a keyword (titles recur across queries and sources)."""
+    title_lower = f"{title} ".lower()
+    return any(kw in title_lower for kw in keywords)
+
+
+def _trie_regex(words: List[str]) -> str:
+    """
+    Build a regex matching any of the words, factored into a prefix trie.
+    
+    The regex engine then walks shared prefixes once instead of trying each
+    word in turn, so a search costs roughly the same for 5 words or 500.
+    
+    Args:
+        words: Literal strings to match.
+        
+    Returns:
+        Regex source.
+    """
+    trie: Dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}
+    
+    def build(node: Dict[str, dict]) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        pattern = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        # A word ends here, so the rest is optional
+        return f"(?:{pattern})?" if '' in node else pattern
+    
+    return build(trie)
+
 
 class BaseScraper(ABC):
     """
@@ -20,6 +90,12 @@ class BaseScraper(ABC):
     # Source name - override in subclass
     SOURCE_NAME = "Base"
     
+    # Per-host request rate cap for this source (requests/second, None = no cap)
+    MAX_REQUESTS_PER_SECOND: Optional[float] = None
+    
+    # Concurrent requests this scraper makes (sizes the keep-alive connection pool)
+    FETCH_WORKERS = 1
+    
     # User agents for rotation
     USER_AGENTS = [
         'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
@@ -49,38 +125,161 @@ class BaseScraper(ABC):
         """
         self.config = config
         self.session = requests.Session()
+        
+        # Own generator for request delays, independent of other scrapers
+        self._rng = random.Random()
+        
+        # Keep-alive pool large enough that concurrent fetches reuse connections
+        # instead of opening (and TLS-handshaking) throwaway ones. Retries are
+        # handled in _safe_request, so the adapter doesn't retry on its own.
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=max(10, self.FETCH_WORKERS))
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # (today, now ISO) shared by every job of the current scrape; see start_batch
+        self._batch_stamp = None
+        
+        # Substring matcher for excluded companies, built once rather than
+        # scanning the whole list for every job in _matches_preferences
+        excluded = [e.lower() for e in config.excluded_companies]
+        self._excluded_re = re.compile(_trie_regex(excluded)) if excluded else None
+        
         self._rotate_headers()
     
     def _rotate_headers(self):
-        """Set random user agent and common headers."""
+        """Set the next user agent in rotation and common headers."""
         self.session.headers.update({
-            'User-Agent': random.choice(self.USER_AGENTS),
+            'User-Agent': self.USER_AGENTS[next(_user_agent_index) % len(self.USER_AGENTS)],
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate, br',
+            # Only encodings urllib3 can decode here ('br' needs the brotli package)
+            'Accept-Encoding': DEFAULT_ACCEPT_ENCODING,
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
         })
     
+    def start_batch(self):
+        """Stamp jobs from the next scrape with one shared date/timestamp."""
+        now = datetime.now()
+        self._batch_stamp = (now.strftime('%Y-%m-%d'), now.isoformat())
+    
     def _random_delay(self, min_sec: float = None, max_sec: float = None):
         """Add random delay between requests."""
         min_sec = min_sec or self.config.request_delay_min
         max_sec = max_sec or self.config.request_delay_max
-        time.sleep(random.uniform(min_sec, max_sec))
+        time.sleep(self._rng.uniform(min_sec, max_sec))
+    
+    def _min_request_interval(self) -> float:
+        """Minimum seconds between request starts to one host (0 = unthrottled)."""
+        rates = [r for r in (self.config.request_rate_limit, self.MAX_REQUESTS_PER_SECOND) if r and r > 0]
+        return 1.0 / min(rates) if rates else 0.0
+    
+    def _wait_for_host(self, url: str):
+        """Block until a request to url's host is allowed by the rate limit."""
+        interval = self._min_request_interval()
+        host = urlsplit(url).netloc
+        
+        # Reserve the next slot under the lock, sleep outside it. Hosts are
+        # also held back here after a server asked us to slow down.
+        with _host_lock:
+            now = time.monotonic()
+            start = max(now, _host_next_request.get(host, 0.0))
+            if interval:
+                _host_next_request[host] = start + interval
+        
+        if start > now:
+            time.sleep(start - now)
+    
+    @staticmethod
+    def _rate_limit_wait(response: requests.Response) -> float:
+        """
+        Seconds the server asked us to wait, from Retry-After or X-RateLimit-*.
+        
+        Args:
+            response: Any response from the host.
+            
+        Returns:
+            Wait in seconds (capped at MAX_RATE_LIMIT_WAIT), or 0 if none.
+        """
+        headers = response.headers
+        wait = 0.0
+        
+        retry_after = headers.get('Retry-After', '').strip()
+        if retry_after.isdigit():
+            wait = float(retry_after)
+        elif retry_after:
+            try:
+                wait = parsedate_to_datetime(retry_after).timestamp() - time.time()
+            except (TypeError, ValueError):
+                pass
+        elif headers.get('X-RateLimit-Remaining', '').strip() == '0':
+            reset = headers.get('X-RateLimit-Reset', '').strip()
+            if reset.isdigit():
+                # Either an epoch timestamp or seconds from now, depending on the API
+                wait = int(reset) - time.time() if int(reset) > 1_000_000_000 else float(reset)
+        
+        return min(max(wait, 0.0), MAX_RATE_LIMIT_WAIT)
+    
+    def _defer_host(self, url: str, wait: float):
+        """Hold back every scraper's requests to url's host for wait seconds."""
+        host = urlsplit(url).netloc
+        with _host_lock:
+            resume = time.monotonic() + wait
+            if resume > _host_next_request.get(host, 0.0):
+                _host_next_request[host] = resume
     
-    def _is_ai_ml_job(self, title: str, description: str = "") -> bool:
+    def _retry_delay(self, attempt: int, response: Optional[requests.Response] = None) -> float:
+        """
+        Exponential backoff (1s, 2s, 4s... capped at 10s) before a retry.
+        
+        No extra delay when the server sent a rate-limit hint: the host was
+        already deferred, so _wait_for_host waits out the hinted time.
+        """
+        if response is not None and self._rate_limit_wait(response):
+            return 0.0
+        return min(2.0 ** attempt, 10.0)
+    
+    def _is_ai_ml_job(self, title: str, description: str = "", combined_lower: str = None) -> bool:
         """
         Check if a job is AI/ML related based on title and description.
         
         Args:
             title: Job title.
             description: Job description (optional).
+            combined_lower: Already-lowercased text to scan instead of
+                title + description (optional).
             
         Returns:
             True if AI/ML related.
         """
-        combined = f"{title} {description}".lower()
-        return any(kw in combined for kw in self.AI_ML_KEYWORDS)
+        keywords = _SCAN_KEYWORDS.get(type(self))
+        if keywords is None:
+            # 'ml engineer' can only match where 'ml ' does, so it never needs its own scan
+            keywords = _SCAN_KEYWORDS[type(self)] = tuple(
+                kw for kw in self.AI_ML_KEYWORDS
+                if not any(other != kw and other in kw for other in self.AI_ML_KEYWORDS)
+            )
+        
+        # A keyword in the title settles it without scanning the description
+        if title and _title_has_keyword(keywords, title):
+            return True
+        
+        if combined_lower is not None:
+            return any(kw in combined_lower for kw in keywords)
+        
+        if not description:
+            return False
+        
+        # Scan the description on its own rather than copying it into a
+        # title + description string; only a keyword straddling the join
+        # (e.g. title "... machine", description "learning ...") needs both.
+        description_lower = description.lower()
+        if any(kw in description_lower for kw in keywords):
+            return True
+        
+        span = max(map(len, keywords))
+        seam = f"{title[-span:]} {description[:span]}".lower()
+        return any(kw in seam for kw in keywords)
     
     def _matches_preferences(self, job: Dict[str, Any]) -> bool:
         """
@@ -93,10 +292,8 @@ class BaseScraper(ABC):
             True if matches preferences.
         """
         # Check excluded companies
-        company = job.get('company', '').lower()
-        for excluded in self.config.excluded_companies:
-            if excluded.lower() in company:
-                return False
+        if self._excluded_re and self._excluded_re.search(job.get('company', '').lower()):
+            return False
         
         # Check location preferences (if strict matching enabled)
         # For now, we're lenient - let the AI scorer handle location preferences
@@ -123,19 +320,25 @@ class BaseScraper(ABC):
         Returns:
             Standardized job dictionary.
         """
+        if self._batch_stamp:
+            today, now_iso = self._batch_stamp
+        else:
+            now = datetime.now()
+            today, now_iso = now.strftime('%Y-%m-%d'), now.isoformat()
+        
         return {
             'title': title.strip() if title else 'Unknown',
             'company': company.strip() if company else 'Unknown',
             'location': location.strip() if location else 'Remote',
             'link': link.strip() if link else '',
-            'date_posted': date_posted or datetime.now().strftime('%Y-%m-%d'),
+            'date_posted': date_posted or today,
             'source': self.SOURCE_NAME,
             'description': description[:1000] if description else '',  # Truncate
             'salary': salary,
             'job_type': job_type,  # remote, hybrid, onsite
             'experience_level': experience_level,  # junior, mid, senior
             'skills': skills or [],
-            'scraped_at': datetime.now().isoformat(),
+            'scraped_at': now_iso,
             **extra
         }
     
@@ -143,6 +346,12 @@ class BaseScraper(ABC):
         """
         Make a safe HTTP request with error handling.
         
+        Requests are spaced per host by the configured rate limit (and by
+        any Retry-After/X-RateLimit hints the host sends), at most
+        MAX_CONCURRENT_REQUESTS are in flight across all scrapers, and
+        timeouts, connection errors and 429/5xx responses are retried
+        with exponential backoff.
+        
         Args:
             url: URL to request.
             method: HTTP method.
@@ -151,30 +360,145 @@ class BaseScraper(ABC):
         Returns:
             Response object or None if failed.
         """
-        try:
-            kwargs.setdefault('timeout', 30)
-            
-            if method.upper() == 'GET':
-                response = self.session.get(url, **kwargs)
-            elif method.upper() == 'POST':
-                response = self.session.post(url, **kwargs)
-            else:
-                response = self.session.request(method, url, **kwargs)
+        kwargs.setdefault('timeout', 30)
+        max_retries = max(0, self.config.request_max_retries)
+        
+        for attempt in range(max_retries + 1):
+            response = None
+            try:
+                self._wait_for_host(url)
+                
+                with _request_slots:
+                    if method.upper() == 'GET':
+                        response = self.session.get(url, **kwargs)
+                    elif method.upper() == 'POST':
+                        response = self.session.post(url, **kwargs)
+                    else:
+                        response = self.session.request(method, url, **kwargs)
+                
+                # Honor the server's rate-limit hints for every scraper on this host
+                wait = self._rate_limit_wait(response)
+                if wait:
+                    self._defer_host(url, wait)
+                
+                response.raise_for_status()
+                return response
+                
+            except requests.exceptions.HTTPError as e:
+                if response.status_code not in RETRY_STATUSES or attempt == max_retries:
+                    logger.warning(f"{self.SOURCE_NAME}: HTTP error for {url}: {e}")
+                    return None
+            except requests.exceptions.ConnectionError as e:
+                if attempt == max_retries:
+                    logger.warning(f"{self.SOURCE_NAME}: Connection error for {url}")
+                    return None
+            except requests.exceptions.Timeout as e:
+                if attempt == max_retries:
+                    logger.warning(f"{self.SOURCE_NAME}: Timeout for {url}")
+                    return None
+            except Exception as e:
+                logger.error(f"{self.SOURCE_NAME}: Request error for {url}: {e}")
+                return None
             
-            response.raise_for_status()
-            return response
+            delay = self._retry_delay(attempt, response)
+            logger.debug(f"{self.SOURCE_NAME}: Retrying {url} in {delay:.1f}s (attempt {attempt + 1}/{max_retries})")
+            time.sleep(delay)
+        
+        return None
+    
+    def _fetch_all(self, urls: List[str], **kwargs) -> List[Optional[requests.Response]]:
+        """
+        Fetch several URLs concurrently, up to FETCH_WORKERS at a time.
+        
+        Args:
+            urls: URLs to request.
+            **kwargs: Additional arguments for _safe_request.
             
-        except requests.exceptions.HTTPError as e:
-            logger.warning(f"{self.SOURCE_NAME}: HTTP error for {url}: {e}")
-        except requests.exceptions.ConnectionError as e:
-            logger.warning(f"{self.SOURCE_NAME}: Connection error for {url}")
-        except requests.exceptions.Timeout as e:
-            logger.warning(f"{self.SOURCE_NAME}: Timeout for {url}")
-        except Exception as e:
-            logger.error(f"{self.SOURCE_NAME}: Request error for {url}: {e}")
+        Returns:
+            Response (or None if failed) for each URL, in the same order.
+        """
+        if self.FETCH_WORKERS <= 1 or len(urls) <= 1:
+            return [self._safe_request(url, **kwargs) for url in urls]
+        
+        with ThreadPoolExecutor(max_workers=min(self.FETCH_WORKERS, len(urls))) as pool:
+            return list(pool.map(lambda url: self._safe_request(url, **kwargs), urls))
+    
+    @staticmethod
+    def _parse_json(response: requests.Response) -> Any:
+        """
+        Decode a JSON response body (orjson parses the raw bytes directly).
+        
+        Bodies orjson rejects but the json module accepts (e.g. a lone
+        surrogate escape in one posting) are decoded with response.json().
+        """
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            return response.json()
+    
+    @staticmethod
+    def _parse_html(response: requests.Response):
+        """
+        Parse an HTML response body into an lxml element tree.
         
+        The raw bytes are decoded with the charset from the Content-Type
+        header (or a detected one if Python doesn't know it), else the page's
+        own <meta charset>, else UTF-8 (lxml alone would fall back to
+        latin-1 and garble non-ASCII text).
+        """
+        body = response.content
+        encoding = None
+        if 'charset' in response.headers.get('Content-Type', '').lower():
+            encoding = response.encoding
+        elif b'charset' not in body[:4096].lower():
+            encoding = 'utf-8'
+        
+        parser = None
+        if encoding:
+            try:
+                parser = lxml.html.HTMLParser(encoding=encoding)
+            except LookupError:
+                # Unrecognised header charset: guess from the body, else UTF-8
+                # (undecodable bytes become U+FFFD)
+                logger.debug(f"Unknown charset {encoding!r}, detecting it from the body")
+                try:
+                    parser = lxml.html.HTMLParser(encoding=response.apparent_encoding or 'utf-8')
+                except LookupError:
+                    parser = lxml.html.HTMLParser(encoding='utf-8')
+        return lxml.html.fromstring(body, parser=parser)
+    
+    @staticmethod
+    def _parse_xml(response: requests.Response):
+        """
+        Parse an XML (e.g. RSS) response body into an lxml element tree.
+        
+        Uses libxml2's recovering parser, so feeds with minor errors still
+        yield their well-formed items.
+        
+        Raises:
+            ValueError: If the body holds no XML document.
+        """
+        root = etree.fromstring(response.content, etree.XMLParser(recover=True))
+        if root is None:
+            raise ValueError("Empty XML document")
+        return root
+    
+    @staticmethod
+    def _first(elem, queries: list):
+        """Return the first element matched by the compiled XPath queries, tried in order."""
+        for query in queries:
+            found = query(elem)
+            if found:
+                return found[0]
         return None
     
+    @staticmethod
+    def _text(elem) -> str:
+        """lxml element text with each string stripped and joined (like bs4 get_text(strip=True))."""
+        if elem is None:
+            return ''
+        return ''.join(s.strip() for s in elem.itertext())
+    
     @abstractmethod
     def scrape(self, max_jobs: int = 50) -> List[Dict[str, Any]]:
         """
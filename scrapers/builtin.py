@@ -1,14 +1,24 @@
 
-import re
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from urllib.parse import quote_plus
-from bs4 import BeautifulSoup
+
+from lxml import etree
 
 from .base import BaseScraper
 
 logger = logging.getLogger(__name__)
 
+# Card queries, compiled once and evaluated by libxml2. Each field lists its
+# fallbacks in priority order; the first query with a match wins.
+_CARDS = etree.XPath('//div[contains(@class, "job-card") or contains(@class, "job-listing")]')
+_ARTICLES = etree.XPath('//article')
+_TITLE = [etree.XPath(p) for p in ('.//h2', './/h3', './/a[contains(@class, "title")]', './/a')]
+_COMPANY = [etree.XPath(f'.//{tag}[contains(@class, "company")]') for tag in ('span', 'div')]
+_LOCATION = [etree.XPath(f'.//{tag}[contains(@class, "location")]') for tag in ('span', 'div')]
+_LINK = [etree.XPath('.//a[@href]')]
+_DESC = [etree.XPath(p) for p in ('.//p', './/div[contains(@class, "description")]')]
+
 
 class BuiltInScraper(BaseScraper):
     """Scraper for BuiltIn job listings."""
@@ -23,32 +33,36 @@ class BuiltInScraper(BaseScraper):
         "https://builtin.com/jobs/data-science",
     ]
     
+    # Listing pages are fetched together (one request per site)
+    FETCH_WORKERS = len(CITY_SITES)
+    
     def scrape(self, max_jobs: int = 50) -> List[Dict[str, Any]]:
         """Scrape BuiltIn for AI/ML jobs."""
         jobs = []
         seen = set()
         
-        for url in self.CITY_SITES:
+        logger.info(f"  {self.SOURCE_NAME}: Checking {len(self.CITY_SITES)} listing pages...")
+        self._random_delay(2, 4)
+        
+        # Fetch every listing page at once, then parse them in order
+        responses = self._fetch_all(self.CITY_SITES)
+        
+        for response in responses:
             if len(jobs) >= max_jobs:
                 break
             
-            logger.info(f"  {self.SOURCE_NAME}: Checking {url.split('/')[-1]}...")
-            self._random_delay(2, 4)
-            
-            response = self._safe_request(url)
-            
             if not response:
                 continue
             
             try:
-                soup = BeautifulSoup(response.text, 'html.parser')
+                doc = self._parse_html(response)
                 
                 # Find job cards
-                job_cards = soup.find_all('div', class_=re.compile(r'job-card|job-listing'))
+                job_cards = _CARDS(doc)
                 
                 if not job_cards:
                     # Try alternative selectors
-                    job_cards = soup.find_all('article')
+                    job_cards = _ARTICLES(doc)
                 
                 for card in job_cards[:20]:
                     if len(jobs) >= max_jobs:
@@ -60,7 +74,7 @@ class BuiltInScraper(BaseScraper):
                         continue
                     
                     # Check for duplicates
-                    key = f"{job['title']}|{job['company']}".lower()
+                    key = (job['title'].lower(), job['company'].lower())
                     if key in seen:
                         continue
                     seen.add(key)
@@ -78,32 +92,27 @@ class BuiltInScraper(BaseScraper):
         logger.info(f"  {self.SOURCE_NAME}: Found {len(jobs)} AI/ML jobs")
         return jobs
     
-    def _parse_job_card(self, card) -> Dict[str, Any]:
-        """Parse a BuiltIn job card."""
+    def _parse_job_card(self, card) -> Optional[Dict[str, Any]]:
+        """Parse a BuiltIn job card (an lxml element)."""
         try:
             # Title
-            title_elem = card.find('h2') or card.find('h3') or card.find('a', class_=re.compile(r'title'))
-            if not title_elem:
-                title_elem = card.find('a')
-            title = title_elem.get_text(strip=True) if title_elem else ''
+            title = self._text(self._first(card, _TITLE))
             
             if not title or len(title) < 3:
                 return None
             
             # Company
-            company_elem = card.find('span', class_=re.compile(r'company')) or \
-                          card.find('div', class_=re.compile(r'company'))
-            company = company_elem.get_text(strip=True) if company_elem else 'Unknown'
+            company_elem = self._first(card, _COMPANY)
+            company = self._text(company_elem) if company_elem is not None else 'Unknown'
             
             # Location
-            location_elem = card.find('span', class_=re.compile(r'location')) or \
-                           card.find('div', class_=re.compile(r'location'))
-            location = location_elem.get_text(strip=True) if location_elem else 'Remote'
+            location_elem = self._first(card, _LOCATION)
+            location = self._text(location_elem) if location_elem is not None else 'Remote'
             
             # Link
-            link_elem = card.find('a', href=True)
+            link_elem = self._first(card, _LINK)
             link = ''
-            if link_elem:
+            if link_elem is not None:
                 href = link_elem.get('href', '')
                 if href.startswith('/'):
                     link = f"{self.BASE_URL}{href}"
@@ -111,8 +120,7 @@ class BuiltInScraper(BaseScraper):
                     link = href
             
             # Description snippet
-            desc_elem = card.find('p') or card.find('div', class_=re.compile(r'description'))
-            description = desc_elem.get_text(strip=True) if desc_elem else ''
+            description = self._text(self._first(card, _DESC))
             
             return self._standardize_job(
                 title=title,
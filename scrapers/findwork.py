@@ -16,6 +16,7 @@ class FindworkScraper(BaseScraper):
     def scrape(self, max_jobs: int = 50) -> List[Dict[str, Any]]:
         """Scrape Findwork for AI/ML jobs."""
         jobs = []
+        seen = set()
         
         # Search queries
         queries = ['machine learning', 'data scientist', 'AI engineer', 'deep learning']
@@ -34,7 +35,7 @@ class FindworkScraper(BaseScraper):
                 continue
             
             try:
-                data = response.json()
+                data = self._parse_json(response)
                 job_list = data.get('results', [])
                 
                 for item in job_list:
@@ -69,10 +70,14 @@ class FindworkScraper(BaseScraper):
                         employment_type=item.get('employment_type', ''),
                     )
                     
-                    # Avoid duplicates
-                    if not any(j['title'] == job['title'] and j['company'] == job['company'] for j in jobs):
-                        if self._matches_preferences(job):
-                            jobs.append(job)
+                    # Avoid duplicates across queries
+                    key = (job['title'].lower(), job['company'].lower())
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    
+                    if self._matches_preferences(job):
+                        jobs.append(job)
                 
             except Exception as e:
                 logger.error(f"  {self.SOURCE_NAME}: Parse error - {e}")
@@ -2,12 +2,20 @@
 import re
 import logging
 from typing import List, Dict, Any
-from bs4 import BeautifulSoup
 
 from .base import BaseScraper
 
 logger = logging.getLogger(__name__)
 
+# Markdown list/table row: first non-empty cell holds [Company](url), next one
+# the location. Heading lines ('#...') never match.
+_ROW_RE = re.compile(
+    r'^(?!#)[ \t\r|]*'
+    r'[^|\n]*?\[([^\]|\n]+)\]\(([^)|\n]+)\)[^|\n]*'
+    r'\|[ \t\r|]*([^|\n]*?)[ \t\r]*(?:\||$)',
+    re.MULTILINE,
+)
+
 
 class GitHubJobsScraper(BaseScraper):
     """Scraper for GitHub-related job sources."""
@@ -48,38 +56,18 @@ class GitHubJobsScraper(BaseScraper):
             try:
                 content = response.text
                 
-                # Parse markdown to find company entries
+                # Parse markdown to find company entries in one pass
                 # Format typically: | [Company](url) | Location | ...
-                lines = content.split('\n')
-                
-                for line in lines:
+                for row in _ROW_RE.finditer(content):
                     if len(jobs) >= max_jobs:
                         break
                     
-                    # Skip non-table rows
-                    if '|' not in line or line.startswith('#'):
-                        continue
-                    
-                    # Parse table row
-                    parts = [p.strip() for p in line.split('|')]
-                    parts = [p for p in parts if p]  # Remove empty
+                    company, link, location = row.groups()
                     
-                    if len(parts) < 2:
+                    # Rows need a location cell
+                    if not location:
                         continue
                     
-                    # Extract company name and link
-                    company_part = parts[0]
-                    link_match = re.search(r'\[([^\]]+)\]\(([^)]+)\)', company_part)
-                    
-                    if link_match:
-                        company = link_match.group(1)
-                        link = link_match.group(2)
-                    else:
-                        continue
-                    
-                    # Location if available
-                    location = parts[1] if len(parts) > 1 else 'Unknown'
-                    
                     # Check if it's a tech company (basic heuristic)
                     # This list is about "hiring without whiteboards" - tech companies
                     job = self._standardize_job(
@@ -1,12 +1,21 @@
 import re
+import html
 import logging
-from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
 
 from .base import BaseScraper
 
 logger = logging.getLogger(__name__)
 
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+# Salary range ("$120k - $150k", "$120k to $150k", "120k-150k"), one pass
+_SALARY_RE = re.compile(
+    r'\$[\d,]+k?\s*(?:-|to|–)\s*\$[\d,]+k?|[\d,]+k\s*-\s*[\d,]+k',
+    re.IGNORECASE,
+)
+
 
 class HackerNewsScraper(BaseScraper):
     """Scraper for Hacker News Who's Hiring threads."""
@@ -15,6 +24,22 @@ class HackerNewsScraper(BaseScraper):
     API_BASE = "https://hacker-news.firebaseio.com/v0"
     HN_USER = "whoishiring"
     
+    # Item requests in flight at once. This is HN's official Firebase API, which
+    # is not rate limited, so items are fetched without delays between them
+    # (REQUEST_RATE_LIMIT still applies per host if set).
+    FETCH_WORKERS = 16
+    
+    def _fetch_item(self, item_id: int) -> Optional[Dict[str, Any]]:
+        """Fetch one HN item, or None if the request fails or the item is gone."""
+        response = self._safe_request(f"{self.API_BASE}/item/{item_id}.json")
+        if not response:
+            return None
+        try:
+            return self._parse_json(response)
+        except ValueError as e:
+            logger.debug(f"  {self.SOURCE_NAME}: Bad item {item_id}: {e}")
+            return None
+    
     def scrape(self, max_jobs: int = 50) -> List[Dict[str, Any]]:
         """Scrape Hacker News for AI/ML jobs."""
         jobs = []
@@ -29,96 +54,83 @@ class HackerNewsScraper(BaseScraper):
         if not response:
             return jobs
         
+        pool = ThreadPoolExecutor(max_workers=self.FETCH_WORKERS)
         try:
-            user_data = response.json()
+            user_data = self._parse_json(response)
             submissions = user_data.get('submitted', [])[:10]  # Check recent submissions
             
-            # Find the "Who is hiring?" thread
-            hiring_thread_id = None
-            current_month = datetime.now().strftime("%B %Y")
+            # Find the "Who is hiring?" thread (newest first; fetched concurrently)
+            hiring_thread = None
             
-            for submission_id in submissions:
-                self._random_delay(0.5, 1)
-                item_url = f"{self.API_BASE}/item/{submission_id}.json"
-                item_response = self._safe_request(item_url)
-                
-                if item_response:
-                    item = item_response.json()
-                    title = item.get('title', '')
-                    if 'who is hiring' in title.lower():
-                        hiring_thread_id = submission_id
-                        logger.info(f"  {self.SOURCE_NAME}: Found thread: {title}")
-                        break
+            for item in pool.map(self._fetch_item, submissions):
+                if item and 'who is hiring' in item.get('title', '').lower():
+                    hiring_thread = item
+                    logger.info(f"  {self.SOURCE_NAME}: Found thread: {item.get('title', '')}")
+                    break
             
-            if not hiring_thread_id:
+            if not hiring_thread:
                 logger.warning(f"  {self.SOURCE_NAME}: No hiring thread found")
                 return jobs
             
-            # Get the thread and its comments
-            thread_url = f"{self.API_BASE}/item/{hiring_thread_id}.json"
-            thread_response = self._safe_request(thread_url)
-            
-            if not thread_response:
-                return jobs
-            
-            thread = thread_response.json()
-            comment_ids = thread.get('kids', [])[:200]  # Limit to first 200 comments
+            # The submission fetch already returned the thread with its comment ids
+            comment_ids = hiring_thread.get('kids', [])[:200]  # Limit to first 200 comments
             
             logger.info(f"  {self.SOURCE_NAME}: Processing {len(comment_ids)} job posts...")
             
-            for comment_id in comment_ids:
+            # Fetch comments a batch at a time (in order) so we can stop at max_jobs
+            for start in range(0, len(comment_ids), self.FETCH_WORKERS):
                 if len(jobs) >= max_jobs:
                     break
                 
-                self._random_delay(0.3, 0.6)
-                comment_url = f"{self.API_BASE}/item/{comment_id}.json"
-                comment_response = self._safe_request(comment_url)
-                
-                if not comment_response:
-                    continue
-                
-                comment = comment_response.json()
-                text = comment.get('text', '')
+                batch = comment_ids[start:start + self.FETCH_WORKERS]
                 
-                if not text:
-                    continue
-                
-                # Parse the job posting
-                job = self._parse_hn_job(text, comment_id)
-                
-                if job and self._is_ai_ml_job(job.get('title', ''), text):
-                    if self._matches_preferences(job):
-                        jobs.append(job)
+                for comment_id, comment in zip(batch, pool.map(self._fetch_item, batch)):
+                    if len(jobs) >= max_jobs:
+                        break
+                    
+                    text = comment.get('text', '') if comment else ''
+                    
+                    if not text:
+                        continue
+                    
+                    # Clean HTML, then lowercase once for parsing and filtering
+                    text = html.unescape(_HTML_TAG_RE.sub(' ', text))
+                    text_lower = text.lower()
+                    
+                    # Parse the job posting
+                    job = self._parse_hn_job(text, comment_id, text_lower)
+                    
+                    # The title comes from the text, so the text alone covers both
+                    if job and self._is_ai_ml_job(job.get('title', ''), combined_lower=text_lower):
+                        if self._matches_preferences(job):
+                            jobs.append(job)
             
             logger.info(f"  {self.SOURCE_NAME}: Found {len(jobs)} AI/ML jobs")
             
         except Exception as e:
             logger.error(f"  {self.SOURCE_NAME}: Error - {e}")
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
         
         return jobs
     
-    def _parse_hn_job(self, text: str, comment_id: int) -> Dict[str, Any]:
+    def _parse_hn_job(self, text: str, comment_id: int, text_lower: str) -> Dict[str, Any]:
         """
-        Parse a Hacker News job comment.
+        Parse a Hacker News job comment (HTML already stripped).
         
         HN job posts typically follow the format:
         Company Name | Position | Location | Remote/Onsite | ...
         """
-        # Clean HTML
-        text = re.sub(r'<[^>]+>', ' ', text)
-        text = text.replace('&amp;', '&').replace('&lt;', '<').replace('&gt;', '>')
-        text = text.replace('&#x27;', "'").replace('&quot;', '"')
-        
         # Try to extract info from the first line (usually has the format)
         lines = text.strip().split('\n')
         first_line = lines[0] if lines else text[:200]
         
-        # Parse pipe-separated format
-        parts = [p.strip() for p in first_line.split('|')]
+        # Parse pipe-separated format (only the first three fields are used)
+        parts = first_line.split('|', 3)
         
-        company = parts[0] if len(parts) > 0 else 'Unknown'
-        title = parts[1] if len(parts) > 1 else 'Unknown Position'
-        location = parts[2] if len(parts) > 2 else 'Unknown'
+        company = parts[0].strip()
+        title = parts[1].strip() if len(parts) > 1 else 'Unknown Position'
+        location = parts[2].strip() if len(parts) > 2 else 'Unknown'
         
         # Clean up
         company = company[:100]  # Limit length
@@ -132,7 +144,6 @@ class HackerNewsScraper(BaseScraper):
         
         # Determine job type
         job_type = 'unknown'
-        text_lower = text.lower()
         if 'remote' in text_lower:
             job_type = 'remote'
         elif 'onsite' in text_lower or 'on-site' in text_lower:
@@ -141,17 +152,8 @@ class HackerNewsScraper(BaseScraper):
             job_type = 'hybrid'
         
         # Try to extract salary
-        salary = ''
-        salary_patterns = [
-            r'\$[\d,]+k?\s*-\s*\$[\d,]+k?',
-            r'\$[\d,]+k?\s*(?:to|–)\s*\$[\d,]+k?',
-            r'[\d,]+k\s*-\s*[\d,]+k',
-        ]
-        for pattern in salary_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                salary = match.group(0)
-                break
+        match = _SALARY_RE.search(text)
+        salary = match.group(0) if match else ''
         
         return self._standardize_job(
             title=title,
@@ -26,7 +26,7 @@ class HimalayasScraper(BaseScraper):
             return jobs
         
         try:
-            data = response.json()
+            data = self._parse_json(response)
             job_list = data if isinstance(data, list) else data.get('jobs', [])
             
             for item in job_list[:100]:  # Limit to first 100
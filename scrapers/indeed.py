@@ -1,22 +1,39 @@
 
-import re
 import logging
 from datetime import datetime, timedelta
-from typing import List, Dict, Any
+from itertools import islice
+from typing import List, Dict, Any, Optional
 from urllib.parse import quote_plus
-from bs4 import BeautifulSoup
+
+from lxml import etree
 
 from .base import BaseScraper
 
 logger = logging.getLogger(__name__)
 
+# Search-page card queries (compiled once; fallbacks listed in priority order)
+_CARDS = etree.XPath('//div[contains(@class, "job_seen_beacon") or contains(@class, "cardOutline")]')
+_RESULT_CELLS = etree.XPath('//td[contains(concat(" ", normalize-space(@class), " "), " resultContent ")]')
+_TITLE = [etree.XPath('.//h2'), etree.XPath('.//a[contains(@class, "title")]')]
+_COMPANY = [etree.XPath('.//span[contains(@class, "company")]')]
+_LOCATION = [etree.XPath('.//div[contains(@class, "location")]')]
+_LINK = [etree.XPath('.//a[@href]')]
+
 
 class IndeedScraper(BaseScraper):
     """Scraper for Indeed job listings."""
     
     SOURCE_NAME = "Indeed"
+    MAX_REQUESTS_PER_SECOND = 0.25  # Bot protection: at most one request every 4s
     BASE_URL = "https://www.indeed.com"
     
+    # RSS queries
+    RSS_QUERIES = ['machine+learning+engineer', 'data+scientist', 'AI+engineer']
+    
+    # RSS queries are in flight together; the 4s host spacing still staggers
+    # their starts, but each one's response time overlaps the next one's wait
+    FETCH_WORKERS = len(RSS_QUERIES)
+    
     def scrape(self, max_jobs: int = 50) -> List[Dict[str, Any]]:
         """Scrape Indeed for AI/ML jobs."""
         jobs = []
@@ -32,7 +49,7 @@ class IndeedScraper(BaseScraper):
         seen = set()
         unique_jobs = []
         for job in jobs:
-            key = f"{job['title']}|{job['company']}".lower()
+            key = (job['title'].lower(), job['company'].lower())
             if key not in seen:
                 seen.add(key)
                 unique_jobs.append(job)
@@ -44,18 +61,15 @@ class IndeedScraper(BaseScraper):
         """Try to scrape via Indeed RSS feed."""
         jobs = []
         
-        queries = ['machine+learning+engineer', 'data+scientist', 'AI+engineer']
+        logger.info(f"  {self.SOURCE_NAME}: Trying RSS for {len(self.RSS_QUERIES)} queries...")
+        self._random_delay(1, 2)
         
-        for query in queries:
+        responses = self._fetch_all([f"{self.BASE_URL}/rss?q={query}&l=Remote" for query in self.RSS_QUERIES])
+        
+        for response in responses:
             if len(jobs) >= max_jobs:
                 break
             
-            logger.info(f"  {self.SOURCE_NAME}: Trying RSS for '{query}'...")
-            self._random_delay(1, 2)
-            
-            rss_url = f"https://www.indeed.com/rss?q={query}&l=Remote"
-            response = self._safe_request(rss_url)
-            
             if not response:
                 continue
             
@@ -63,35 +77,36 @@ class IndeedScraper(BaseScraper):
                 continue
             
             try:
-                soup = BeautifulSoup(response.text, 'xml')
-                items = soup.find_all('item')
+                root = self._parse_xml(response)
                 
-                for item in items[:15]:
+                for item in islice(root.iter('item'), 15):
                     if len(jobs) >= max_jobs:
                         break
                     
                     title_elem = item.find('title')
                     link_elem = item.find('link')
                     
-                    if not title_elem or not link_elem:
+                    if title_elem is None or link_elem is None:
                         continue
                     
-                    title_text = title_elem.get_text()
+                    title_text = ''.join(title_elem.itertext())
                     
                     # Filter for AI/ML
                     if not self._is_ai_ml_job(title_text):
                         continue
                     
                     # Parse "Title - Company" format
-                    parts = title_text.rsplit(' - ', 1)
-                    title = parts[0].strip()
-                    company = parts[1].strip() if len(parts) > 1 else 'Unknown'
+                    title, sep, company = title_text.rpartition(' - ')
+                    if sep:
+                        title, company = title.strip(), company.strip()
+                    else:
+                        title, company = company.strip(), 'Unknown'
                     
                     job = self._standardize_job(
                         title=title,
                         company=company,
                         location='Remote',
-                        link=link_elem.get_text().strip(),
+                        link=''.join(link_elem.itertext()).strip(),
                     )
                     
                     if self._matches_preferences(job):
@@ -126,13 +141,13 @@ class IndeedScraper(BaseScraper):
                 break
             
             try:
-                soup = BeautifulSoup(response.text, 'html.parser')
+                doc = self._parse_html(response)
                 
                 # Find job cards
-                job_cards = soup.find_all('div', class_=re.compile(r'job_seen_beacon|cardOutline'))
+                job_cards = _CARDS(doc)
                 
                 if not job_cards:
-                    job_cards = soup.find_all('td', class_='resultContent')
+                    job_cards = _RESULT_CELLS(doc)
                 
                 for card in job_cards[:15]:
                     if len(jobs) >= max_jobs:
@@ -148,25 +163,25 @@ class IndeedScraper(BaseScraper):
         
         return jobs
     
-    def _parse_job_card(self, card) -> Dict[str, Any]:
-        """Parse an Indeed job card."""
+    def _parse_job_card(self, card) -> Optional[Dict[str, Any]]:
+        """Parse an Indeed job card (an lxml element)."""
         try:
             # Title
-            title_elem = card.find('h2') or card.find('a', class_=re.compile(r'title'))
-            title = title_elem.get_text(strip=True) if title_elem else 'Unknown'
+            title_elem = self._first(card, _TITLE)
+            title = self._text(title_elem) if title_elem is not None else 'Unknown'
             
             # Company
-            company_elem = card.find('span', class_=re.compile(r'company'))
-            company = company_elem.get_text(strip=True) if company_elem else 'Unknown'
+            company_elem = self._first(card, _COMPANY)
+            company = self._text(company_elem) if company_elem is not None else 'Unknown'
             
             # Location
-            location_elem = card.find('div', class_=re.compile(r'location'))
-            location = location_elem.get_text(strip=True) if location_elem else 'Remote'
+            location_elem = self._first(card, _LOCATION)
+            location = self._text(location_elem) if location_elem is not None else 'Remote'
             
             # Link
-            link_elem = card.find('a', href=True)
+            link_elem = self._first(card, _LINK)
             link = ''
-            if link_elem:
+            if link_elem is not None:
                 href = link_elem.get('href', '')
                 if href.startswith('/'):
                     link = f"{self.BASE_URL}{href}"
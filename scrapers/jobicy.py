@@ -11,36 +11,49 @@ class JobicyScraper(BaseScraper):
     """Scraper for Jobicy job listings."""
     
     SOURCE_NAME = "Jobicy"
+    MAX_REQUESTS_PER_SECOND = 5
     API_URL = "https://jobicy.com/api/v2/remote-jobs"
     
+    # Search tags for AI/ML jobs
+    TAGS = ['data-science', 'machine-learning', 'artificial-intelligence', 'python', 'data']
+    
+    # All tag searches are sent at once
+    FETCH_WORKERS = len(TAGS)
+    
     def scrape(self, max_jobs: int = 50) -> List[Dict[str, Any]]:
         """Scrape Jobicy for AI/ML jobs."""
         jobs = []
+        seen = set()
+        seen_ids = set()  # Jobicy ids already handled (tag feeds overlap heavily)
         
-        # Search tags for AI/ML jobs
-        tags = ['data-science', 'machine-learning', 'artificial-intelligence', 'python', 'data']
+        logger.info(f"  {self.SOURCE_NAME}: Searching tags {', '.join(self.TAGS)}...")
+        self._random_delay(1, 2)
         
-        for tag in tags:
+        # Fetch every tag concurrently, then merge in tag order
+        responses = self._fetch_all([f"{self.API_URL}?count=50&tag={tag}" for tag in self.TAGS])
+        
+        for response in responses:
             if len(jobs) >= max_jobs:
                 break
             
-            logger.info(f"  {self.SOURCE_NAME}: Searching tag '{tag}'...")
-            self._random_delay(1, 2)
-            
-            url = f"{self.API_URL}?count=50&tag={tag}"
-            response = self._safe_request(url)
-            
             if not response:
                 continue
             
             try:
-                data = response.json()
+                data = self._parse_json(response)
                 job_list = data.get('jobs', [])
                 
                 for item in job_list:
                     if len(jobs) >= max_jobs:
                         break
                     
+                    # Skip postings already seen under an earlier tag before any parsing
+                    job_id = item.get('id')
+                    if job_id is not None:
+                        if job_id in seen_ids:
+                            continue
+                        seen_ids.add(job_id)
+                    
                     title = item.get('jobTitle', '')
                     description = item.get('jobDescription', '')
                     
@@ -69,10 +82,14 @@ class JobicyScraper(BaseScraper):
                         experience_level=item.get('jobLevel', ''),
                     )
                     
-                    # Avoid duplicates
-                    if not any(j['title'] == job['title'] and j['company'] == job['company'] for j in jobs):
-                        if self._matches_preferences(job):
-                            jobs.append(job)
+                    # Avoid duplicates across tags
+                    key = (job['title'].lower(), job['company'].lower())
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    
+                    if self._matches_preferences(job):
+                        jobs.append(job)
                 
             except Exception as e:
                 logger.error(f"  {self.SOURCE_NAME}: Parse error - {e}")
@@ -1,19 +1,28 @@
 
-import re
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from urllib.parse import quote_plus
-from bs4 import BeautifulSoup
+from requests.utils import DEFAULT_ACCEPT_ENCODING
+
+from lxml import etree
 
 from .base import BaseScraper
 
 logger = logging.getLogger(__name__)
 
+# Job card queries (compiled once; fallbacks listed in priority order)
+_CARDS = etree.XPath('//div[contains(@class, "job-search-card") or contains(@class, "base-card")]')
+_TITLE = [etree.XPath('.//h3'), etree.XPath('.//span[contains(@class, "title")]')]
+_COMPANY = [etree.XPath('.//h4'), etree.XPath('.//a[contains(@class, "company")]')]
+_LOCATION = [etree.XPath('.//span[contains(@class, "location")]')]
+_LINK = [etree.XPath('.//a[@href]')]
+
 
 class LinkedInScraper(BaseScraper):
     """Scraper for LinkedIn job listings via public feeds."""
     
     SOURCE_NAME = "LinkedIn"
+    MAX_REQUESTS_PER_SECOND = 0.25  # Bot protection: at most one request every 4s
     
     # LinkedIn job search URL (public, limited)
     SEARCH_URL = "https://www.linkedin.com/jobs/search/"
@@ -42,19 +51,20 @@ class LinkedInScraper(BaseScraper):
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
                 'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
                 'Accept-Language': 'en-US,en;q=0.9',
-                'Accept-Encoding': 'gzip, deflate, br',
+                'Accept-Encoding': DEFAULT_ACCEPT_ENCODING,
                 'Connection': 'keep-alive',
                 'Cache-Control': 'max-age=0',
             }
             
             try:
+                self._wait_for_host(url)
                 response = self.session.get(url, headers=headers, timeout=30)
                 
                 if response.status_code == 200:
-                    soup = BeautifulSoup(response.text, 'html.parser')
+                    doc = self._parse_html(response)
                     
                     # Try to find job cards
-                    job_cards = soup.find_all('div', class_=re.compile(r'job-search-card|base-card'))
+                    job_cards = _CARDS(doc)
                     
                     for card in job_cards[:20]:
                         if len(jobs) >= max_jobs:
@@ -78,24 +88,24 @@ class LinkedInScraper(BaseScraper):
         
         return jobs
     
-    def _parse_job_card(self, card) -> Dict[str, Any]:
-        """Parse a LinkedIn job card."""
+    def _parse_job_card(self, card) -> Optional[Dict[str, Any]]:
+        """Parse a LinkedIn job card (an lxml element)."""
         try:
             # Title
-            title_elem = card.find('h3') or card.find('span', class_=re.compile(r'title'))
-            title = title_elem.get_text(strip=True) if title_elem else 'Unknown'
+            title_elem = self._first(card, _TITLE)
+            title = self._text(title_elem) if title_elem is not None else 'Unknown'
             
             # Company
-            company_elem = card.find('h4') or card.find('a', class_=re.compile(r'company'))
-            company = company_elem.get_text(strip=True) if company_elem else 'Unknown'
+            company_elem = self._first(card, _COMPANY)
+            company = self._text(company_elem) if company_elem is not None else 'Unknown'
             
             # Location
-            location_elem = card.find('span', class_=re.compile(r'location'))
-            location = location_elem.get_text(strip=True) if location_elem else 'Unknown'
+            location_elem = self._first(card, _LOCATION)
+            location = self._text(location_elem) if location_elem is not None else 'Unknown'
             
             # Link
-            link_elem = card.find('a', href=True)
-            link = link_elem.get('href', '') if link_elem else ''
+            link_elem = self._first(card, _LINK)
+            link = link_elem.get('href', '') if link_elem is not None else ''
             if link and not link.startswith('http'):
                 link = f"https://www.linkedin.com{link}"
             
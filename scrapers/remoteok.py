@@ -1,6 +1,6 @@
 
 import logging
-from datetime import datetime
+from datetime import date
 from typing import List, Dict, Any
 
 from .base import BaseScraper
@@ -12,6 +12,7 @@ class RemoteOKScraper(BaseScraper):
     """Scraper for RemoteOK job listings."""
     
     SOURCE_NAME = "RemoteOK"
+    MAX_REQUESTS_PER_SECOND = 5
     API_URL = "https://remoteok.com/api"
     
     def scrape(self, max_jobs: int = 50) -> List[Dict[str, Any]]:
@@ -27,7 +28,7 @@ class RemoteOKScraper(BaseScraper):
             return jobs
         
         try:
-            data = response.json()
+            data = self._parse_json(response)
             
             if not isinstance(data, list):
                 logger.warning(f"  {self.SOURCE_NAME}: Unexpected response format")
@@ -36,6 +37,9 @@ class RemoteOKScraper(BaseScraper):
             # First item is usually legal info
             job_list = data[1:] if len(data) > 1 else data
             
+            # Posting day -> validated 'YYYY-MM-DD' (None if unparseable); many jobs share a day
+            date_cache = {}
+            
             for item in job_list:
                 if len(jobs) >= max_jobs:
                     break
@@ -50,13 +54,15 @@ class RemoteOKScraper(BaseScraper):
                 if not self._is_ai_ml_job(title, description):
                     continue
                 
-                # Parse date
-                date_str = item.get('date', '')
-                try:
-                    dt = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-                    date_posted = dt.strftime('%Y-%m-%d')
-                except:
-                    date_posted = datetime.now().strftime('%Y-%m-%d')
+                # Parse date (ISO timestamp; its first 10 chars are the posting day).
+                # Unparseable dates fall back to today in _standardize_job.
+                day = str(item.get('date') or '')[:10]
+                if day not in date_cache:
+                    try:
+                        date_cache[day] = date.fromisoformat(day).isoformat()
+                    except ValueError:
+                        date_cache[day] = None
+                date_posted = date_cache[day]
                 
                 # Build link
                 slug = item.get('slug', '')
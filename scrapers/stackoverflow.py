@@ -1,5 +1,6 @@
 
 import logging
+from itertools import islice
 from typing import List, Dict, Any
 
 from .base import BaseScraper
@@ -43,11 +44,9 @@ class StackOverflowScraper(BaseScraper):
                 continue
             
             try:
-                from bs4 import BeautifulSoup
-                soup = BeautifulSoup(response.text, 'xml')
-                items = soup.find_all('item')
+                root = self._parse_xml(response)
                 
-                for item in items[:30]:
+                for item in islice(root.iter('item'), 30):
                     if len(jobs) >= max_jobs:
                         break
                     
@@ -55,28 +54,28 @@ class StackOverflowScraper(BaseScraper):
                     link = item.find('link')
                     description = item.find('description')
                     
-                    if not title or not link:
+                    if title is None or link is None:
                         continue
                     
-                    title_text = title.get_text()
-                    desc_text = description.get_text() if description else ''
+                    title_text = ''.join(title.itertext())
+                    desc_text = ''.join(description.itertext()) if description is not None else ''
                     
                     # Filter for AI/ML jobs
                     if not self._is_ai_ml_job(title_text, desc_text):
                         continue
                     
                     # Extract company from title (format: "Title at Company")
-                    company = 'Unknown'
-                    if ' at ' in title_text:
-                        parts = title_text.rsplit(' at ', 1)
-                        title_text = parts[0]
-                        company = parts[1]
+                    head, sep, company = title_text.rpartition(' at ')
+                    if sep:
+                        title_text = head
+                    else:
+                        company = 'Unknown'
                     
                     job = self._standardize_job(
                         title=title_text,
                         company=company,
                         location='Remote',
-                        link=link.get_text(),
+                        link=''.join(link.itertext()),
                         description=desc_text[:500],
                         job_type='remote',
                     )
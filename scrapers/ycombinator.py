@@ -1,6 +1,7 @@
 
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, Optional, Tuple
+from urllib.parse import urlencode
 
 from .base import BaseScraper
 
@@ -13,78 +14,99 @@ class YCombinatorScraper(BaseScraper):
     SOURCE_NAME = "Y Combinator"
     API_URL = "https://www.workatastartup.com/api/companies/search"
     
+    # Search queries
+    QUERIES = ['machine learning', 'AI', 'data science', 'deep learning']
+    
+    # All searches are sent at once
+    FETCH_WORKERS = len(QUERIES)
+    
     def scrape(self, max_jobs: int = 50) -> List[Dict[str, Any]]:
         """Scrape Y Combinator startups for AI/ML jobs."""
         jobs = []
+        seen = set()
         
-        # Search queries
-        queries = ['machine learning', 'AI', 'data science', 'deep learning']
+        logger.info(f"  {self.SOURCE_NAME}: Searching {len(self.QUERIES)} queries...")
+        self._random_delay(2, 3)
         
-        for query in queries:
+        # Fetch every query concurrently, then merge in query order
+        responses = self._fetch_all([
+            f"{self.API_URL}?{urlencode({'query': query, 'page': 1})}" for query in self.QUERIES
+        ])
+        
+        for company, job_item in self._iter_postings(responses):
             if len(jobs) >= max_jobs:
                 break
             
-            logger.info(f"  {self.SOURCE_NAME}: Searching '{query}'...")
-            self._random_delay(2, 3)
+            job = self._parse_posting(company, job_item, seen)
+            if job:
+                jobs.append(job)
+        
+        logger.info(f"  {self.SOURCE_NAME}: Found {len(jobs)} AI/ML jobs")
+        return jobs
+    
+    def _parse_posting(self, company: Dict[str, Any], job_item: Dict[str, Any], seen: set) -> Optional[Dict[str, Any]]:
+        """Build one matching AI/ML job from a posting, or None if skipped or malformed."""
+        try:
+            title = job_item.get('title', '')
+            company_name = company.get('name', 'YC Startup')
+            
+            # Filter for AI/ML jobs
+            if not self._is_ai_ml_job(title):
+                return None
             
-            params = {'query': query, 'page': 1}
-            response = self._safe_request(self.API_URL, params=params)
+            # Avoid duplicates across queries (before building the job)
+            key = (str(title).strip().lower(), str(company_name or 'Unknown').strip().lower())
+            if key in seen:
+                return None
+            seen.add(key)
             
+            # Build link
+            job_slug = job_item.get('slug', '')
+            company_slug = company.get('slug', '')
+            if job_slug:
+                link = f"https://www.workatastartup.com/jobs/{job_slug}"
+            elif company_slug:
+                link = f"https://www.workatastartup.com/companies/{company_slug}"
+            else:
+                link = "https://www.workatastartup.com"
+            
+            # Determine job type
+            job_type = 'remote' if job_item.get('remote', False) else 'onsite'
+            
+            job = self._standardize_job(
+                title=title,
+                company=company_name,
+                location=job_item.get('location', 'San Francisco') or 'Remote',
+                link=link,
+                description=job_item.get('description', ''),
+                salary=job_item.get('salary_range', ''),
+                job_type=job_type,
+                experience_level=job_item.get('experience', ''),
+            )
+            return job if self._matches_preferences(job) else None
+        except Exception as e:
+            logger.debug(f"  {self.SOURCE_NAME}: Posting parse error - {e}")
+            return None
+    
+    def _iter_postings(self, responses: List[Any]) -> Iterator[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """Yield (company, job item) pairs from the search responses, in query order."""
+        for response in responses:
             if not response:
                 continue
             
             try:
-                data = response.json()
-                companies = data.get('companies', [])
-                
-                for company in companies[:30]:
-                    if len(jobs) >= max_jobs:
-                        break
-                    
-                    company_name = company.get('name', 'YC Startup')
-                    company_slug = company.get('slug', '')
-                    company_jobs = company.get('jobs', [])
-                    
-                    for job_item in company_jobs:
-                        if len(jobs) >= max_jobs:
-                            break
-                        
-                        title = job_item.get('title', '')
-                        
-                        # Filter for AI/ML jobs
-                        if not self._is_ai_ml_job(title):
-                            continue
-                        
-                        # Build link
-                        job_slug = job_item.get('slug', '')
-                        if job_slug:
-                            link = f"https://www.workatastartup.com/jobs/{job_slug}"
-                        elif company_slug:
-                            link = f"https://www.workatastartup.com/companies/{company_slug}"
-                        else:
-                            link = "https://www.workatastartup.com"
-                        
-                        # Determine job type
-                        job_type = 'remote' if job_item.get('remote', False) else 'onsite'
-                        
-                        job = self._standardize_job(
-                            title=title,
-                            company=company_name,
-                            location=job_item.get('location', 'San Francisco') or 'Remote',
-                            link=link,
-                            description=job_item.get('description', ''),
-                            salary=job_item.get('salary_range', ''),
-                            job_type=job_type,
-                            experience_level=job_item.get('experience', ''),
-                        )
-                        
-                        # Avoid duplicates
-                        if not any(j['title'] == job['title'] and j['company'] == job['company'] for j in jobs):
-                            if self._matches_preferences(job):
-                                jobs.append(job)
-                
+                companies = self._parse_json(response).get('companies') or []
+                companies = list(companies)[:30]
             except Exception as e:
                 logger.debug(f"  {self.SOURCE_NAME}: Parse error - {e}")
-        
-        logger.info(f"  {self.SOURCE_NAME}: Found {len(jobs)} AI/ML jobs")
-        return jobs
+                continue
+            
+            for company in companies:
+                if not isinstance(company, dict):
+                    continue
+                company_jobs = company.get('jobs') or []
+                if not isinstance(company_jobs, list):
+                    continue
+                for job_item in company_jobs:
+                    if isinstance(job_item, dict):
+                        yield company, job_item
@@ -1,19 +1,33 @@
 
 import os
 import csv
-import json
+import mmap
+import atexit
+import sqlite3
 import logging
+import threading
+from collections import Counter
 from datetime import datetime
-from typing import List, Dict, Any, Tuple, Optional
+from typing import List, Dict, Any, Tuple, Optional, Set
 from pathlib import Path
 
+import orjson
+
+from utils.helpers import _normalize_job_key
+
 logger = logging.getLogger(__name__)
 
 
 class LocalStorageClient:
     """
-    Client for local file storage using CSV and JSON.
+    Client for local file storage using CSV and JSON Lines.
     Stores job data with enhanced fields for matching and analytics.
+    
+    Jobs, the dedup index and analytics are loaded once and kept in memory.
+    New rows go through buffered jobs.csv/jobs.jsonl handles kept open for
+    the client's lifetime; flush() writes them out, inserts new keys into
+    the SQLite index and rewrites analytics every FLUSH_EVERY inserts and
+    at exit.
     """
     
     # CSV Headers (enhanced)
@@ -22,13 +36,29 @@ class LocalStorageClient:
         'Relevance Score', 'Match Score', 'Combined Score', 'Status',
         'Matching Skills', 'Missing Skills', 'Salary', 'Job Type'
     ]
+    _N_HEADERS = len(HEADERS)
+    
+    # Job keys and defaults for the export columns before the skill lists
+    _EXPORT_KEYS = (
+        'date_posted', 'title', 'company', 'location', 'link', 'source',
+        'relevance_score', 'match_score', 'combined_score', 'status',
+    )
+    _EXPORT_DEFAULTS = ('',) * 9 + ('New',)
+    
+    # Flush buffered rows and rewrite index/analytics after this many inserts
+    FLUSH_EVERY = 25
+    
+    # Write buffer for the long-lived CSV/JSONL handles
+    WRITE_BUFFER_SIZE = 128 * 1024
     
     def __init__(self, data_dir: str = None):
         """Initialize local storage client."""
         self.data_dir = Path(data_dir or os.getenv('DATA_DIR', './data'))
         self.csv_file = self.data_dir / 'jobs.csv'
-        self.json_file = self.data_dir / 'jobs.json'
-        self.index_file = self.data_dir / 'job_index.json'
+        self.json_file = self.data_dir / 'jobs.jsonl'
+        self.legacy_json_file = self.data_dir / 'jobs.json'
+        self.index_file = self.data_dir / 'job_index.sqlite3'
+        self.legacy_index_file = self.data_dir / 'job_index.json'
         self.analytics_file = self.data_dir / 'analytics.json'
         
         # Create data directory
@@ -37,6 +67,28 @@ class LocalStorageClient:
         # Initialize files
         self._ensure_files_exist()
         
+        # Load everything once
+        self._jobs = self._load_jobs()
+        # Fields get_stats scans, kept as columns alongside the job dicts
+        self._columns = {'source': [], 'relevance_score': [], 'match_score': []}
+        for job in self._jobs:
+            self._add_to_columns(job)
+        self._conn = self._open_index_db()
+        self._index = self._load_index()
+        self._analytics = self._load_analytics()
+        # (key, added_at) rows not yet written to the index database
+        self._new_keys = []
+        self._dirty = False
+        self._reconcile_index()
+        self._pending = 0
+        # Guards the in-memory state and handles (flush() re-enters from append_job)
+        self._lock = threading.RLock()
+        
+        self._csv_fp = open(self.csv_file, 'a', buffering=self.WRITE_BUFFER_SIZE, newline='', encoding='utf-8')
+        self._csv_writer = csv.writer(self._csv_fp)
+        self._jobs_fp = open(self.json_file, 'ab', buffering=self.WRITE_BUFFER_SIZE)
+        atexit.register(self.close)
+        
         logger.info(f"Storage initialized at: {self.data_dir}")
     
     def _ensure_files_exist(self):
@@ -47,70 +99,180 @@ class LocalStorageClient:
                 writer = csv.writer(f)
                 writer.writerow(self.HEADERS)
         
-        # JSON file
+        # JSONL file (migrated from the old single-document jobs.json)
         if not self.json_file.exists():
-            with open(self.json_file, 'w', encoding='utf-8') as f:
-                json.dump({
-                    'jobs': [],
-                    'metadata': {
-                        'created': datetime.now().isoformat(),
-                        'total_jobs': 0,
-                        'version': '2.0'
-                    }
-                }, f, indent=2)
-        
-        # Index file
-        if not self.index_file.exists():
-            with open(self.index_file, 'w', encoding='utf-8') as f:
-                json.dump({'index': {}}, f)
+            self._migrate_legacy_json()
         
         # Analytics file
         if not self.analytics_file.exists():
-            with open(self.analytics_file, 'w', encoding='utf-8') as f:
-                json.dump({
+            with open(self.analytics_file, 'wb') as f:
+                f.write(orjson.dumps({
                     'daily_stats': {},
                     'source_stats': {},
                     'skill_frequency': {}
-                }, f, indent=2)
+                }, option=orjson.OPT_INDENT_2))
     
-    def _normalize_key(self, title: str, company: str) -> str:
-        """Create normalized key for deduplication."""
-        title = ''.join(c.lower() for c in title if c.isalnum() or c.isspace())
-        company = ''.join(c.lower() for c in company if c.isalnum() or c.isspace())
-        return f"{' '.join(title.split())}|{' '.join(company.split())}"
+    def _migrate_legacy_json(self):
+        """Write jobs.jsonl, carrying over jobs from a legacy jobs.json."""
+        jobs = []
+        if self.legacy_json_file.exists():
+            try:
+                with open(self.legacy_json_file, 'rb') as f:
+                    jobs = orjson.loads(f.read()).get('jobs', [])
+                logger.info(f"Migrating {len(jobs)} jobs from {self.legacy_json_file.name} to {self.json_file.name}")
+            except Exception as e:
+                logger.warning(f"Could not read {self.legacy_json_file}: {e}")
+        
+        with open(self.json_file, 'wb') as f:
+            f.write(b''.join(orjson.dumps(job) + b'\n' for job in jobs))
     
-    def _load_index(self) -> Dict[str, str]:
-        """Load job index."""
+    def _load_jobs(self) -> List[Dict[str, Any]]:
+        """Load all jobs from the memory-mapped JSONL file."""
+        jobs = []
+        try:
+            with open(self.json_file, 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return jobs
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                    size = len(mm)
+                    start = 0
+                    while start < size:
+                        end = mm.find(b'\n', start)
+                        if end < 0:
+                            end = size
+                        if end > start:
+                            # Parse straight from the mapping, no per-line copy
+                            with view[start:end] as line:
+                                try:
+                                    jobs.append(orjson.loads(line))
+                                except orjson.JSONDecodeError:
+                                    # Truncated trailing line after a crash
+                                    logger.warning(f"Skipping unreadable line in {self.json_file.name}")
+                        start = end + 1
+                    terminated = mm[size - 1] == 0x0A
+            
+            # Keep the next append from joining a partial last line
+            if not terminated:
+                with open(self.json_file, 'ab') as f:
+                    f.write(b'\n')
+        except FileNotFoundError:
+            pass
+        return jobs
+    
+    def _load_analytics(self) -> Dict[str, Any]:
+        """Load analytics data, with the frequency tables as Counters."""
+        analytics = {'daily_stats': {}, 'source_stats': {}, 'skill_frequency': {}}
         try:
-            with open(self.index_file, 'r', encoding='utf-8') as f:
-                return json.load(f).get('index', {})
+            with open(self.analytics_file, 'rb') as f:
+                analytics.update(orjson.loads(f.read()))
         except:
+            pass
+        analytics['source_stats'] = Counter(analytics['source_stats'])
+        analytics['skill_frequency'] = Counter(analytics['skill_frequency'])
+        return analytics
+    
+    def _add_to_columns(self, job: Dict[str, Any]):
+        """Append a job's stats fields to the column lists."""
+        self._columns['source'].append(job.get('source', 'Unknown'))
+        self._columns['relevance_score'].append(job.get('relevance_score'))
+        self._columns['match_score'].append(job.get('match_score'))
+    
+    def _reconcile_index(self):
+        """Add jobs missing from the index (e.g. written just before a crash)."""
+        for job in self._jobs:
+            key = _normalize_job_key(str(job.get('title', '')), str(job.get('company', '')))
+            if key not in self._index:
+                self._index[key] = job.get('added_at') or datetime.now().isoformat()
+                self._new_keys.append((key, self._index[key]))
+                self._dirty = True
+    
+    def _open_index_db(self) -> sqlite3.Connection:
+        """Open the index database, importing a legacy job_index.json once."""
+        conn = sqlite3.connect(str(self.index_file), check_same_thread=False, isolation_level=None)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('CREATE TABLE IF NOT EXISTS job_index (key TEXT PRIMARY KEY, added_at TEXT NOT NULL)')
+        
+        if self.legacy_index_file.exists() and conn.execute('SELECT 1 FROM job_index LIMIT 1').fetchone() is None:
+            try:
+                with open(self.legacy_index_file, 'rb') as f:
+                    legacy = orjson.loads(f.read()).get('index', {})
+                self._insert_keys(conn, legacy.items())
+                logger.info(f"Imported {len(legacy)} keys from {self.legacy_index_file.name}")
+            except Exception as e:
+                logger.warning(f"Could not import {self.legacy_index_file}: {e}")
+        
+        return conn
+    
+    @staticmethod
+    def _insert_keys(conn: sqlite3.Connection, rows):
+        """Insert (key, added_at) rows in one transaction, keeping existing keys."""
+        conn.execute('BEGIN')
+        try:
+            conn.executemany('INSERT OR IGNORE INTO job_index (key, added_at) VALUES (?, ?)', rows)
+            conn.execute('COMMIT')
+        except:
+            conn.execute('ROLLBACK')
+            raise
+    
+    def _load_index(self) -> Dict[str, str]:
+        """Load job index into memory (lookups stay plain dict hits)."""
+        try:
+            return dict(self._conn.execute('SELECT key, added_at FROM job_index'))
+        except sqlite3.Error as e:
+            logger.error(f"Error loading job index: {e}")
             return {}
     
-    def _save_index(self, index: Dict[str, str]):
-        """Save job index."""
-        with open(self.index_file, 'w', encoding='utf-8') as f:
-            json.dump({'index': index, 'updated': datetime.now().isoformat()}, f, indent=2)
+    def flush(self):
+        """Write pending rows, index and analytics to disk."""
+        with self._lock:
+            for fp in (self._csv_fp, self._jobs_fp):
+                if not fp.closed:
+                    fp.flush()
+            
+            if not self._dirty:
+                return
+            
+            try:
+                if self._new_keys:
+                    self._insert_keys(self._conn, self._new_keys)
+                    self._new_keys = []
+                with open(self.analytics_file, 'wb') as f:
+                    f.write(orjson.dumps(self._analytics, option=orjson.OPT_INDENT_2))
+                self._dirty = False
+                self._pending = 0
+            except Exception as e:
+                logger.error(f"Error flushing storage: {e}")
     
-    def get_existing_jobs(self) -> List[Tuple[str, str]]:
-        """Get existing jobs for deduplication."""
-        index = self._load_index()
-        existing = []
+    def close(self):
+        """Flush and release the file handles."""
+        with self._lock:
+            self.flush()
+            self._csv_fp.close()
+            self._jobs_fp.close()
+            self._conn.close()
+        atexit.unregister(self.close)
+    
+    def get_existing_keys(self) -> Set[str]:
+        """
+        Get normalized 'title|company' keys of stored jobs for deduplication.
         
-        for key in index.keys():
-            if '|' in key:
-                parts = key.split('|', 1)
-                if len(parts) == 2:
-                    existing.append((parts[0], parts[1]))
+        Returns:
+            A new set (callers may add to it), matching utils.helpers.job_key_set().
+        """
+        with self._lock:
+            keys = set(self._index)
         
-        logger.info(f"Retrieved {len(existing)} existing jobs from index")
-        return existing
+        logger.info(f"Retrieved {len(keys)} existing jobs from index")
+        return keys
+    
+    def get_existing_jobs(self) -> List[Tuple[str, str]]:
+        """Get existing jobs as (title, company) tuples for deduplication."""
+        return [tuple(key.split('|', 1)) for key in self.get_existing_keys() if '|' in key]
     
     def job_exists(self, title: str, company: str) -> bool:
         """Check if a job already exists."""
-        index = self._load_index()
-        key = self._normalize_key(title, company)
-        return key in index
+        return _normalize_job_key(title, company) in self._index
     
     def append_job(self, row_data: List[Any], job_dict: Dict[str, Any] = None) -> bool:
         """
@@ -120,56 +282,94 @@ class LocalStorageClient:
             row_data: List of values for CSV row.
             job_dict: Full job dictionary for JSON storage.
         """
-        try:
-            title = str(row_data[1]) if len(row_data) > 1 else ''
-            company = str(row_data[2]) if len(row_data) > 2 else ''
-            
-            # Check for duplicates
-            if self.job_exists(title, company):
-                return False
-            
-            # Pad row data if needed
-            while len(row_data) < len(self.HEADERS):
-                row_data.append('')
+        return self.append_jobs([(row_data, job_dict)])[0]
+    
+    def append_jobs(self, batch: List[Tuple[List[Any], Optional[Dict[str, Any]]]]) -> List[bool]:
+        """
+        Append several jobs in one pass.
+        
+        Jobs already stored, or repeated within the batch, are skipped, as
+        are jobs that can't be encoded. The rest go out in one JSONL write.
+        
+        Args:
+            batch: (row_data, job_dict) pairs, as taken by append_job().
             
-            # Append to CSV
-            with open(self.csv_file, 'a', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                writer.writerow(row_data[:len(self.HEADERS)])
+        Returns:
+            One flag per entry, True if that job was stored.
+        """
+        stored = [False] * len(batch)
+        try:
+            keys = [
+                _normalize_job_key(
+                    str(row_data[1]) if len(row_data) > 1 else '',
+                    str(row_data[2]) if len(row_data) > 2 else '',
+                )
+                for row_data, _ in batch
+            ]
             
-            # Append to JSON
-            if job_dict:
-                with open(self.json_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+            with self._lock:
+                # Check for duplicates
+                new = []
+                batch_keys = set()
+                for i, key in enumerate(keys):
+                    if key not in self._index and key not in batch_keys:
+                        batch_keys.add(key)
+                        new.append(i)
+                if not new:
+                    return stored
                 
-                job_dict['added_at'] = datetime.now().isoformat()
-                data['jobs'].append(job_dict)
-                data['metadata']['total_jobs'] = len(data['jobs'])
-                data['metadata']['last_updated'] = datetime.now().isoformat()
+                now = datetime.now().isoformat()
+                lines = []
+                written = []
+                for i in new:
+                    row_data, job_dict = batch[i]
+                    
+                    # Pad row data if needed
+                    missing = self._N_HEADERS - len(row_data)
+                    if missing > 0:
+                        row_data += [''] * missing
+                    
+                    # One job that can't be encoded (e.g. a lone surrogate) must not lose the rest
+                    try:
+                        line = b''
+                        if job_dict:
+                            job_dict['added_at'] = now
+                            line = orjson.dumps(job_dict) + b'\n'
+                        self._csv_writer.writerow(row_data[:self._N_HEADERS])
+                    except (TypeError, ValueError) as e:
+                        logger.error(f"Error appending job '{keys[i]}': {e}")
+                        continue
+                    lines.append(line)
+                    written.append(i)
                 
-                with open(self.json_file, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=2, ensure_ascii=False)
-            
-            # Update index
-            index = self._load_index()
-            key = self._normalize_key(title, company)
-            index[key] = datetime.now().isoformat()
-            self._save_index(index)
-            
-            # Update analytics
-            self._update_analytics(job_dict or {})
-            
-            return True
+                # Append to JSONL
+                self._jobs_fp.write(b''.join(lines))
+                
+                # Update jobs, index and analytics in memory
+                for i in written:
+                    job_dict = batch[i][1]
+                    if job_dict:
+                        self._jobs.append(job_dict)
+                        self._add_to_columns(job_dict)
+                    self._index[keys[i]] = now
+                    self._new_keys.append((keys[i], now))
+                    self._update_analytics(job_dict or {})
+                    stored[i] = True
+                
+                self._dirty = True
+                self._pending += len(written)
+                if self._pending >= self.FLUSH_EVERY:
+                    self.flush()
             
         except Exception as e:
-            logger.error(f"Error appending job: {e}")
-            return False
+            logger.error(f"Error appending jobs: {e}")
+        
+        return stored
     
     def _update_analytics(self, job: Dict[str, Any]):
         """Update analytics data."""
         try:
-            with open(self.analytics_file, 'r', encoding='utf-8') as f:
-                analytics = json.load(f)
+            analytics = self._analytics
             
             today = datetime.now().strftime('%Y-%m-%d')
             
@@ -179,32 +379,21 @@ class LocalStorageClient:
             analytics['daily_stats'][today]['count'] += 1
             
             # Source stats
-            source = job.get('source', 'Unknown')
-            analytics['source_stats'][source] = analytics['source_stats'].get(source, 0) + 1
+            analytics['source_stats'][job.get('source', 'Unknown')] += 1
             
             # Skill frequency
-            for skill in job.get('matching_skills', []):
-                skill_lower = skill.lower()
-                analytics['skill_frequency'][skill_lower] = analytics['skill_frequency'].get(skill_lower, 0) + 1
+            analytics['skill_frequency'].update(skill.lower() for skill in job.get('matching_skills', []))
             
-            with open(self.analytics_file, 'w', encoding='utf-8') as f:
-                json.dump(analytics, f, indent=2)
-                
         except Exception as e:
             logger.debug(f"Analytics update failed: {e}")
     
     def get_all_jobs(self) -> List[Dict[str, Any]]:
-        """Get all jobs from JSON storage."""
-        try:
-            with open(self.json_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                return data.get('jobs', [])
-        except:
-            return []
+        """Get all jobs (the in-memory list; treat as read-only)."""
+        return self._jobs
     
     def get_job_count(self) -> int:
         """Get total number of jobs."""
-        return len(self.get_all_jobs())
+        return len(self._jobs)
     
     def get_stats(self) -> Dict[str, Any]:
         """Get storage statistics."""
@@ -214,38 +403,24 @@ class LocalStorageClient:
             'total_jobs': len(jobs),
             'csv_file': str(self.csv_file),
             'json_file': str(self.json_file),
-            'sources': {},
+            'sources': dict(Counter(self._columns['source'])),
             'avg_relevance_score': 0,
             'avg_match_score': 0,
             'top_skills': [],
         }
         
-        relevance_scores = []
-        match_scores = []
-        
-        for job in jobs:
-            # Source counts
-            source = job.get('source', 'Unknown')
-            stats['sources'][source] = stats['sources'].get(source, 0) + 1
-            
-            # Scores
-            if job.get('relevance_score'):
-                relevance_scores.append(job['relevance_score'])
-            if job.get('match_score'):
-                match_scores.append(job['match_score'])
+        # Column scans, no per-job dict lookups
+        relevance_scores = [score for score in self._columns['relevance_score'] if score]
+        match_scores = [score for score in self._columns['match_score'] if score]
         
         if relevance_scores:
             stats['avg_relevance_score'] = round(sum(relevance_scores) / len(relevance_scores), 1)
         if match_scores:
             stats['avg_match_score'] = round(sum(match_scores) / len(match_scores), 1)
         
-        # Load skill frequency from analytics
+        # Skill frequency from analytics
         try:
-            with open(self.analytics_file, 'r', encoding='utf-8') as f:
-                analytics = json.load(f)
-            skill_freq = analytics.get('skill_frequency', {})
-            sorted_skills = sorted(skill_freq.items(), key=lambda x: x[1], reverse=True)
-            stats['top_skills'] = [s[0] for s in sorted_skills[:10]]
+            stats['top_skills'] = [skill for skill, _ in self._analytics['skill_frequency'].most_common(10)]
         except:
             pass
         
@@ -261,24 +436,16 @@ class LocalStorageClient:
             writer = csv.writer(f)
             writer.writerow(self.HEADERS)
             
-            for job in jobs:
-                row = [
-                    job.get('date_posted', ''),
-                    job.get('title', ''),
-                    job.get('company', ''),
-                    job.get('location', ''),
-                    job.get('link', ''),
-                    job.get('source', ''),
-                    job.get('relevance_score', ''),
-                    job.get('match_score', ''),
-                    job.get('combined_score', ''),
-                    job.get('status', 'New'),
+            writer.writerows(
+                [
+                    *map(job.get, self._EXPORT_KEYS, self._EXPORT_DEFAULTS),
                     ', '.join(job.get('matching_skills', [])[:5]),
                     ', '.join(job.get('missing_skills', [])[:5]),
                     job.get('salary', ''),
                     job.get('job_type', ''),
                 ]
-                writer.writerow(row)
+                for job in jobs
+            )
         
         return str(output_path)
 
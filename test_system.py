@@ -2,7 +2,7 @@
 import os
 import sys
 import logging
-import subprocess
+import argparse
 from datetime import datetime
 
 logging.basicConfig(
@@ -52,64 +52,38 @@ def test_environment():
 
 
 def test_ollama():
-    """Test Ollama installation."""
+    """Test Ollama server."""
     print_header("2. Testing Ollama (Local LLM)")
     
-    try:
-        result = subprocess.run(
-            ['ollama', '--version'],
-            capture_output=True, text=True, timeout=10,
-            encoding='utf-8', errors='ignore'
-        )
-        if result.returncode == 0:
-            print(f"  ✓ Ollama installed: {result.stdout.strip()}")
-        else:
-            print(f"  ✗ Ollama error")
-            return False
-    except FileNotFoundError:
-        print("  ✗ Ollama not found - install from ollama.com/download")
-        return False
-    except Exception as e:
-        print(f"  ✗ Error: {e}")
+    from llm.ollama_client import OllamaClient
+    client = OllamaClient(os.getenv('OLLAMA_HOST'))
+    
+    version = client.version()
+    if version:
+        print(f"  ✓ Ollama running: {version} ({client.host})")
+    else:
+        print(f"  ✗ Ollama not reachable at {client.host} - install from ollama.com/download and start it")
         return False
     
     # Check models
-    try:
-        result = subprocess.run(
-            ['ollama', 'list'],
-            capture_output=True, text=True, timeout=10,
-            encoding='utf-8', errors='ignore'
-        )
-        if result.returncode == 0:
-            lines = result.stdout.strip().split('\n')
-            if len(lines) > 1:
-                print(f"  ✓ Available models:")
-                for line in lines[1:]:
-                    if line.strip():
-                        print(f"      {line.split()[0]}")
-            else:
-                print("  ⚠ No models found. Run: ollama pull llama3")
-                return False
-    except Exception as e:
-        print(f"  ✗ Error listing models: {e}")
+    models = client.list_models()
+    if models:
+        print(f"  ✓ Available models:")
+        for name in models:
+            print(f"      {name}")
+    else:
+        print("  ⚠ No models found. Run: ollama pull llama3")
         return False
     
     # Test inference
     model = os.getenv('OLLAMA_MODEL', 'llama3')
     print(f"\n  Testing model '{model}'...")
     
-    try:
-        result = subprocess.run(
-            ['ollama', 'run', model, 'Say OK'],
-            capture_output=True, text=True, timeout=60,
-            encoding='utf-8', errors='ignore'
-        )
-        if result.returncode == 0 and result.stdout.strip():
-            print(f"  ✓ Model responding")
-            return True
-    except Exception as e:
-        print(f"  ✗ Model test failed: {e}")
+    if client.generate(model, 'Say OK', timeout=60):
+        print(f"  ✓ Model responding")
+        return True
     
+    print(f"  ✗ Model test failed")
     return False
 
 
@@ -141,6 +115,7 @@ def test_scrapers():
     config = Config()
     config.enabled_sources = ['remoteok', 'jobicy']  # Test just 2
     
+    from concurrent.futures import ThreadPoolExecutor, as_completed
     from scrapers import JobScraperManager
     
     manager = JobScraperManager(config)
@@ -150,22 +125,27 @@ def test_scrapers():
     total_jobs = 0
     results = {}
     
-    for name in manager.scrapers:
-        print(f"\n  {name}...")
-        try:
-            jobs = manager.scrape_source(name)
-            if jobs:
-                print(f"  ✓ {name}: Found {len(jobs)} jobs")
+    # Sources are independent network fetches; report each as it finishes
+    max_workers = max(1, min(config.scraper_workers, len(manager.scrapers)))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(manager.scrape_source, name): name for name in manager.scrapers}
+        for future in as_completed(futures):
+            name = futures[future]
+            print(f"\n  {name}...")
+            try:
+                jobs = future.result()
                 if jobs:
-                    print(f"      Sample: {jobs[0].get('title', 'N/A')[:40]}...")
-                results[name] = True
-                total_jobs += len(jobs)
-            else:
-                print(f"  ⚠ {name}: No jobs (may be rate limited)")
+                    print(f"  ✓ {name}: Found {len(jobs)} jobs")
+                    if jobs:
+                        print(f"      Sample: {jobs[0].get('title', 'N/A')[:40]}...")
+                    results[name] = True
+                    total_jobs += len(jobs)
+                else:
+                    print(f"  ⚠ {name}: No jobs (may be rate limited)")
+                    results[name] = False
+            except Exception as e:
+                print(f"  ✗ {name}: Error - {e}")
                 results[name] = False
-        except Exception as e:
-            print(f"  ✗ {name}: Error - {e}")
-            results[name] = False
     
     print(f"\n  Total jobs found: {total_jobs}")
     return any(results.values())
@@ -278,21 +258,34 @@ def test_email():
         return False
 
 
-def run_all_tests():
-    """Run all tests."""
+# --only name -> (summary label, test); each test imports what it needs
+TESTS = {
+    'env': ('Environment', test_environment),
+    'ollama': ('Ollama', test_ollama),
+    'storage': ('Storage', test_storage),
+    'scrapers': ('Scrapers', test_scrapers),
+    'matcher': ('Resume Matcher', test_resume_matcher),
+    'scorer': ('Job Scorer', test_job_scorer),
+    'email': ('Email', test_email),
+}
+
+
+def run_all_tests(only=None):
+    """
+    Run all tests, or just the named ones.
+    
+    Args:
+        only: Optional list of TESTS keys to run.
+    """
     print("\n" + "=" * 60)
     print(" AI/ML JOB ALERT SYSTEM v2.0 - Component Tests")
     print("=" * 60)
     print(f" Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     
     results = {
-        'Environment': test_environment(),
-        'Ollama': test_ollama(),
-        'Storage': test_storage(),
-        'Scrapers': test_scrapers(),
-        'Resume Matcher': test_resume_matcher(),
-        'Job Scorer': test_job_scorer(),
-        'Email': test_email(),
+        label: test()
+        for name, (label, test) in TESTS.items()
+        if not only or name in only
     }
     
     print_header("TEST SUMMARY")
@@ -320,5 +313,13 @@ def run_all_tests():
 
 
 if __name__ == "__main__":
-    success = run_all_tests()
+    parser = argparse.ArgumentParser(description='AI/ML Job Alert System - component tests')
+    parser.add_argument('--only', nargs='+', choices=list(TESTS), help='Run only these tests')
+    args = parser.parse_args()
+    
+    # Load .env before any test builds a client or Config, whichever tests run
+    from dotenv import load_dotenv
+    load_dotenv()
+    
+    success = run_all_tests(args.only)
     sys.exit(0 if success else 1)
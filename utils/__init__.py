@@ -1,7 +1,10 @@
 
 from .helpers import (
     retry_with_backoff,
+    job_key_set,
     deduplicate_jobs,
+    fuzzy_key_index,
+    fuzzy_deduplicate_jobs,
     format_job_for_storage,
     clean_text,
     truncate_text,
@@ -9,11 +12,14 @@ from .helpers import (
     parse_salary,
     get_relative_time,
 )
-from .config import Config, SKILL_CATEGORIES, ALL_SKILLS
+from .config import Config, get_config, SKILL_CATEGORIES, ALL_SKILLS
 
 __all__ = [
     'retry_with_backoff',
+    'job_key_set',
     'deduplicate_jobs',
+    'fuzzy_key_index',
+    'fuzzy_deduplicate_jobs',
     'format_job_for_storage',
     'clean_text',
     'truncate_text',
@@ -21,6 +27,7 @@ __all__ = [
     'parse_salary',
     'get_relative_time',
     'Config',
+    'get_config',
     'SKILL_CATEGORIES',
     'ALL_SKILLS',
 ]
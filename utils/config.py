@@ -1,81 +1,128 @@
 
 import os
-import json
 import logging
+import functools
 from pathlib import Path
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass, field
+from typing import List, Dict, Any, Optional, Set, ClassVar, Sequence
+from dataclasses import dataclass, field, fields, MISSING
+
+import orjson
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+# Defaults for list settings; Config gets its own list copy of these
+DEFAULT_PREFERRED_LOCATIONS = ('Remote', 'USA', 'Europe')
+
+DEFAULT_ENABLED_SOURCES = (
+    'remoteok',
+    'jobicy',
+    'arbeitnow',
+    'findwork',
+    'himalayas',
+    'ycombinator',
+    'hackernews',
+    'github',
+    'stackoverflow',
+    'linkedin',
+    'indeed',
+    'builtin',
+)
+
+DEFAULT_SEARCH_KEYWORDS = (
+    'machine learning',
+    'AI engineer',
+    'data scientist',
+    'deep learning',
+    'MLOps',
+    'NLP',
+    'computer vision',
+    'LLM',
+)
+
+
+@dataclass(init=False, slots=True)
 class Config:
     """
     Application configuration with defaults.
     Values can be overridden via environment variables or config file.
+    
+    Field defaults are evaluated once per process (see _default_values) and
+    copied into each instance, instead of running every factory per Config().
     """
     
+    # data_dir values already created in this process
+    _dirs_created: ClassVar[Set[str]] = set()
+    
     # Data storage
-    data_dir: str = field(default_factory=lambda: os.getenv('DATA_DIR', './data'))
+    data_dir: str = field(default_factory=lambda: _getenv('DATA_DIR', './data'))
     
     # Email settings
-    gmail_address: str = field(default_factory=lambda: os.getenv('GMAIL_ADDRESS', ''))
-    gmail_app_password: str = field(default_factory=lambda: os.getenv('GMAIL_APP_PASSWORD', ''))
-    notification_email: str = field(default_factory=lambda: os.getenv('NOTIFICATION_EMAIL', ''))
+    gmail_address: str = field(default_factory=lambda: _getenv('GMAIL_ADDRESS', ''))
+    gmail_app_password: str = field(default_factory=lambda: _getenv('GMAIL_APP_PASSWORD', ''))
+    notification_email: str = field(default_factory=lambda: _getenv('NOTIFICATION_EMAIL', ''))
     
     # Ollama settings
-    ollama_model: str = field(default_factory=lambda: os.getenv('OLLAMA_MODEL', 'llama3'))
+    ollama_model: str = field(default_factory=lambda: _getenv('OLLAMA_MODEL', 'llama3'))
+    # Small model for bulk relevance scoring, larger one for detailed analysis
+    ollama_model_fast: str = field(default_factory=lambda: _getenv('OLLAMA_MODEL_FAST') or _getenv('OLLAMA_MODEL', 'llama3'))
+    ollama_model_deep: str = field(default_factory=lambda: _getenv('OLLAMA_MODEL_DEEP') or _getenv('OLLAMA_MODEL', 'llama3'))
+    ollama_host: str = field(default_factory=lambda: _getenv('OLLAMA_HOST', 'http://localhost:11434'))
+    ollama_num_ctx: int = field(default_factory=lambda: int(_getenv('OLLAMA_NUM_CTX', '4096')))
+    ollama_num_parallel: int = field(default_factory=lambda: int(_getenv('OLLAMA_NUM_PARALLEL', '4')))
+    
+    # Only ask the LLM about jobs the title keywords can't decide
+    llm_only_ambiguous: bool = field(default_factory=lambda: _parse_bool_env('LLM_ONLY_AMBIGUOUS', True))
+    
+    # Persist LLM scores/matches in DATA_DIR between runs
+    llm_cache: bool = field(default_factory=lambda: _parse_bool_env('LLM_CACHE', True))
     
     # Scoring thresholds
-    min_relevance_score: int = field(default_factory=lambda: int(os.getenv('MIN_RELEVANCE_SCORE', '5')))
-    min_combined_score: float = field(default_factory=lambda: float(os.getenv('MIN_COMBINED_SCORE', '5.0')))
+    min_relevance_score: int = field(default_factory=lambda: int(_getenv('MIN_RELEVANCE_SCORE', '5')))
+    min_combined_score: float = field(default_factory=lambda: float(_getenv('MIN_COMBINED_SCORE', '5.0')))
+    # Resume matching trusts keywords (no LLM) at or above this skill overlap, or at 0%; 0 disables
+    match_keyword_confidence_cutoff: float = field(default_factory=lambda: float(_getenv('MATCH_KEYWORD_CONFIDENCE_CUTOFF', '0.8')))
     
     # Resume file
-    resume_file: str = field(default_factory=lambda: os.getenv('RESUME_FILE', './resume.txt'))
+    resume_file: str = field(default_factory=lambda: _getenv('RESUME_FILE', './resume.txt'))
     
     # Job preferences
-    preferred_locations: List[str] = field(default_factory=lambda: _parse_list_env('PREFERRED_LOCATIONS', ['Remote', 'USA', 'Europe']))
-    excluded_companies: List[str] = field(default_factory=lambda: _parse_list_env('EXCLUDED_COMPANIES', []))
-    min_salary: int = field(default_factory=lambda: int(os.getenv('MIN_SALARY', '0')))
-    experience_level: str = field(default_factory=lambda: os.getenv('EXPERIENCE_LEVEL', 'any'))  # junior, mid, senior, any
-    job_type: str = field(default_factory=lambda: os.getenv('JOB_TYPE', 'any'))  # remote, hybrid, onsite, any
+    preferred_locations: List[str] = field(default_factory=lambda: _parse_list_env('PREFERRED_LOCATIONS', DEFAULT_PREFERRED_LOCATIONS))
+    excluded_companies: List[str] = field(default_factory=lambda: _parse_list_env('EXCLUDED_COMPANIES', ()))
+    min_salary: int = field(default_factory=lambda: int(_getenv('MIN_SALARY', '0')))
+    experience_level: str = field(default_factory=lambda: _getenv('EXPERIENCE_LEVEL', 'any'))  # junior, mid, senior, any
+    job_type: str = field(default_factory=lambda: _getenv('JOB_TYPE', 'any'))  # remote, hybrid, onsite, any
     
     # Enabled job sources
-    enabled_sources: List[str] = field(default_factory=lambda: _parse_list_env('ENABLED_SOURCES', [
-        'remoteok',
-        'jobicy',
-        'arbeitnow',
-        'findwork',
-        'himalayas',
-        'ycombinator',
-        'hackernews',
-        'github',
-        'stackoverflow',
-        'linkedin',
-        'indeed',
-        'builtin',
-    ]))
+    enabled_sources: List[str] = field(default_factory=lambda: _parse_list_env('ENABLED_SOURCES', DEFAULT_ENABLED_SOURCES))
     
     # Scraping settings
-    max_jobs_per_source: int = field(default_factory=lambda: int(os.getenv('MAX_JOBS_PER_SOURCE', '50')))
-    request_delay_min: float = field(default_factory=lambda: float(os.getenv('REQUEST_DELAY_MIN', '1.0')))
-    request_delay_max: float = field(default_factory=lambda: float(os.getenv('REQUEST_DELAY_MAX', '3.0')))
+    max_jobs_per_source: int = field(default_factory=lambda: int(_getenv('MAX_JOBS_PER_SOURCE', '50')))
+    request_delay_min: float = field(default_factory=lambda: float(_getenv('REQUEST_DELAY_MIN', '1.0')))
+    request_delay_max: float = field(default_factory=lambda: float(_getenv('REQUEST_DELAY_MAX', '3.0')))
+    scraper_workers: int = field(default_factory=lambda: int(_getenv('SCRAPER_WORKERS', '12')))  # sources scraped at once
+    request_rate_limit: float = field(default_factory=lambda: float(_getenv('REQUEST_RATE_LIMIT', '0')))  # per host, req/s (0 = off)
+    request_max_retries: int = field(default_factory=lambda: int(_getenv('REQUEST_MAX_RETRIES', '2')))
     
     # Search keywords
-    search_keywords: List[str] = field(default_factory=lambda: _parse_list_env('SEARCH_KEYWORDS', [
-        'machine learning',
-        'AI engineer',
-        'data scientist',
-        'deep learning',
-        'MLOps',
-        'NLP',
-        'computer vision',
-        'LLM',
-    ]))
+    search_keywords: List[str] = field(default_factory=lambda: _parse_list_env('SEARCH_KEYWORDS', DEFAULT_SEARCH_KEYWORDS))
     
     # Skills for matching (will be auto-detected from resume if provided)
-    user_skills: List[str] = field(default_factory=lambda: _parse_list_env('USER_SKILLS', []))
+    user_skills: List[str] = field(default_factory=lambda: _parse_list_env('USER_SKILLS', ()))
+    
+    def __init__(self, **overrides):
+        """Initialize from the cached defaults, then apply keyword overrides."""
+        defaults = _default_values()
+        unknown = overrides.keys() - defaults.keys()
+        if unknown:
+            raise TypeError(f"Config() got unexpected keyword arguments: {', '.join(sorted(unknown))}")
+        
+        # Lists are copied so instances never share mutable defaults
+        for name, value in defaults.items():
+            setattr(self, name, value.copy() if isinstance(value, list) else value)
+        for name, value in overrides.items():
+            setattr(self, name, value)
+        self.__post_init__()
     
     def __post_init__(self):
         """Post-initialization processing."""
@@ -83,24 +130,28 @@ class Config:
         if not self.notification_email:
             self.notification_email = self.gmail_address
         
-        # Ensure data directory exists
-        Path(self.data_dir).mkdir(parents=True, exist_ok=True)
+        # Ensure data directory exists (once per path per process)
+        if self.data_dir not in Config._dirs_created:
+            Path(self.data_dir).mkdir(parents=True, exist_ok=True)
+            Config._dirs_created.add(self.data_dir)
         
         # Load config file if exists
-        config_file = Path('./config.json')
-        if config_file.exists():
-            self._load_from_file(config_file)
+        self._load_from_file(Path('./config.json'))
     
     def _load_from_file(self, config_file: Path):
-        """Load additional config from JSON file."""
+        """Load additional config from JSON file (parsed once per modification)."""
+        try:
+            mtime_ns = config_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            return
+        
         try:
-            with open(config_file, 'r', encoding='utf-8') as f:
-                file_config = json.load(f)
+            file_config = _read_config_file(str(config_file), mtime_ns)
             
-            # Override defaults with file values
+            # Override defaults with file values (copied; the parse is shared)
             for key, value in file_config.items():
                 if hasattr(self, key):
-                    setattr(self, key, value)
+                    setattr(self, key, value.copy() if isinstance(value, (list, dict)) else value)
             
             logger.info(f"Loaded configuration from {config_file}")
         except Exception as e:
@@ -121,8 +172,8 @@ class Config:
             'min_combined_score': self.min_combined_score,
         }
         
-        with open(config_file, 'w', encoding='utf-8') as f:
-            json.dump(config_dict, f, indent=2)
+        with open(config_file, 'wb') as f:
+            f.write(orjson.dumps(config_dict, option=orjson.OPT_INDENT_2))
         
         logger.info(f"Saved configuration to {config_file}")
     
@@ -142,73 +193,134 @@ class Config:
         return issues
 
 
-def _parse_list_env(key: str, default: List[str]) -> List[str]:
-    """Parse comma-separated environment variable into list."""
-    value = os.getenv(key, '')
+@functools.lru_cache(maxsize=None)
+def _environ() -> Dict[str, str]:
+    """
+    Snapshot of the environment, taken on first use.
+    
+    Variables don't change during a run; the first Config() comes after
+    main.py's load_dotenv(). Call _environ.cache_clear() and
+    _default_values.cache_clear() to re-read.
+    """
+    return dict(os.environ)
+
+
+@functools.lru_cache(maxsize=None)
+def _default_values() -> Dict[str, Any]:
+    """Config field defaults, evaluated once from the environment snapshot."""
+    return {
+        f.name: f.default if f.default is not MISSING else f.default_factory()
+        for f in fields(Config)
+    }
+
+
+def _getenv(key: str, default: Optional[str] = None) -> Optional[str]:
+    """os.getenv() against the cached environment snapshot."""
+    return _environ().get(key, default)
+
+
+@functools.lru_cache(maxsize=1)
+def get_config() -> Config:
+    """
+    Shared Config instance, created on first call.
+    
+    Use where a read-only view of the settings is enough; code that
+    adjusts settings for one run (like main.py's CLI flags) should build
+    its own Config().
+    """
+    return Config()
+
+
+@functools.lru_cache(maxsize=8)
+def _read_config_file(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a JSON config file; the mtime in the key invalidates stale entries."""
+    with open(path, 'rb') as f:
+        return orjson.loads(f.read())
+
+
+@functools.lru_cache(maxsize=None)
+def _split_list(value: str) -> tuple:
+    """Items of a comma-separated string (cached; callers copy to a list)."""
+    return tuple(item.strip() for item in value.split(',') if item.strip())
+
+
+def _parse_list_env(key: str, default: Sequence[str]) -> List[str]:
+    """Parse comma-separated environment variable into list (default is copied)."""
+    value = _getenv(key, '')
+    if value:
+        return list(_split_list(value))
+    return list(default)
+
+
+def _parse_bool_env(key: str, default: bool) -> bool:
+    """Parse true/false style environment variable."""
+    value = _getenv(key, '')
     if value:
-        return [item.strip() for item in value.split(',') if item.strip()]
+        return value.strip().lower() in ('1', 'true', 'yes', 'on')
     return default
 
 
 # Skill categories for matching
 SKILL_CATEGORIES = {
-    'programming_languages': [
+    'programming_languages': (
         'python', 'r', 'java', 'scala', 'julia', 'c++', 'c', 'javascript',
         'typescript', 'go', 'rust', 'sql', 'bash', 'shell', 'matlab',
-    ],
-    'ml_frameworks': [
+    ),
+    'ml_frameworks': (
         'tensorflow', 'pytorch', 'keras', 'scikit-learn', 'sklearn', 'xgboost',
         'lightgbm', 'catboost', 'jax', 'mxnet', 'caffe', 'theano', 'paddle',
-    ],
-    'deep_learning': [
+    ),
+    'deep_learning': (
         'neural networks', 'cnn', 'rnn', 'lstm', 'transformer', 'bert', 'gpt',
         'attention mechanism', 'gan', 'vae', 'autoencoder', 'diffusion',
-    ],
-    'ml_concepts': [
+    ),
+    'ml_concepts': (
         'machine learning', 'deep learning', 'supervised learning', 'unsupervised learning',
         'reinforcement learning', 'transfer learning', 'federated learning',
         'feature engineering', 'model training', 'hyperparameter tuning',
-    ],
-    'nlp': [
+    ),
+    'nlp': (
         'nlp', 'natural language processing', 'text classification', 'ner',
         'named entity recognition', 'sentiment analysis', 'language model',
         'word embeddings', 'word2vec', 'transformers', 'huggingface', 'spacy', 'nltk',
-    ],
-    'computer_vision': [
+    ),
+    'computer_vision': (
         'computer vision', 'image classification', 'object detection', 'yolo',
         'image segmentation', 'opencv', 'facial recognition', 'ocr',
-    ],
-    'llm': [
+    ),
+    'llm': (
         'llm', 'large language model', 'gpt', 'chatgpt', 'claude', 'llama',
         'prompt engineering', 'rag', 'retrieval augmented generation',
         'langchain', 'vector database', 'embeddings', 'fine-tuning',
-    ],
-    'mlops': [
+    ),
+    'mlops': (
         'mlops', 'ml pipeline', 'model deployment', 'model serving', 'mlflow',
         'kubeflow', 'airflow', 'dagster', 'prefect', 'dvc', 'model monitoring',
-    ],
-    'cloud_platforms': [
+    ),
+    'cloud_platforms': (
         'aws', 'azure', 'gcp', 'google cloud', 'sagemaker', 'vertex ai',
         'azure ml', 'databricks', 'snowflake', 'bigquery',
-    ],
-    'data_tools': [
+    ),
+    'data_tools': (
         'spark', 'pyspark', 'hadoop', 'kafka', 'airflow', 'dbt',
         'pandas', 'numpy', 'dask', 'ray', 'polars',
-    ],
-    'databases': [
+    ),
+    'databases': (
         'postgresql', 'mysql', 'mongodb', 'redis', 'elasticsearch',
         'pinecone', 'weaviate', 'milvus', 'chromadb', 'neo4j',
-    ],
-    'tools': [
+    ),
+    'tools': (
         'docker', 'kubernetes', 'git', 'linux', 'jupyter', 'vscode',
         'wandb', 'tensorboard', 'grafana', 'prometheus',
-    ],
+    ),
 }
 
 # Flatten all skills for quick lookup
-ALL_SKILLS = set()
-for category_skills in SKILL_CATEGORIES.values():
-    ALL_SKILLS.update(skill.lower() for skill in category_skills)
+ALL_SKILLS = frozenset(
+    skill.lower()
+    for category_skills in SKILL_CATEGORIES.values()
+    for skill in category_skills
+)
 
 
 # For testing
@@ -1,41 +1,78 @@
 
 import os
+import re
 import time
+import random
+import itertools
 import logging
 import functools
+from collections import defaultdict
 from datetime import datetime
-from typing import List, Dict, Any, Tuple, Callable, TypeVar
+from difflib import SequenceMatcher
+from typing import List, Dict, Any, Tuple, Set, Iterable, Callable, TypeVar, Optional
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar('T')
 
 
-def retry_with_backoff(max_retries: int = 3, base_delay: float = 1.0):
-    """Decorator for retrying functions with exponential backoff."""
+def retry_with_backoff(
+    max_retries: int = 3,
+    base_delay: float = 1.0,
+    jitter: float = 0.0,
+    deadline: Optional[float] = None
+):
+    """
+    Decorator for retrying functions with exponential backoff.
+    
+    Args:
+        max_retries: Retries after the first attempt.
+        base_delay: Delay before the first retry; doubled for each retry.
+        jitter: Optional random fraction (0-1) each delay is scaled up or
+            down by, so parallel callers don't retry in lockstep.
+        deadline: Optional limit in seconds on the whole call; a retry whose
+            delay would end past it is not attempted.
+    """
+    # Backoff schedule, computed once per decorated function
+    delays = tuple(base_delay * (1 << attempt) for attempt in range(max_retries))
+    
+    def next_delay(attempt: int, error: Exception, started: float) -> Optional[float]:
+        """Seconds to wait before retrying, or None to give up."""
+        if attempt >= max_retries:
+            return None
+        delay = delays[attempt]
+        if jitter:
+            delay *= random.uniform(1 - jitter, 1 + jitter)
+        if deadline is not None and time.monotonic() - started + delay > deadline:
+            return None
+        logger.warning("Attempt %d failed: %s. Retrying in %.1fs...", attempt + 1, error, delay)
+        return delay
+    
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
         @functools.wraps(func)
         def wrapper(*args, **kwargs) -> T:
-            last_exception = None
-            
-            for attempt in range(max_retries + 1):
+            started = time.monotonic()
+            for attempt in itertools.count():
                 try:
                     return func(*args, **kwargs)
                 except Exception as e:
-                    last_exception = e
-                    if attempt < max_retries:
-                        delay = base_delay * (2 ** attempt)
-                        logger.warning(f"Attempt {attempt + 1} failed: {e}. Retrying in {delay:.1f}s...")
-                        time.sleep(delay)
-            
-            raise last_exception
+                    delay = next_delay(attempt, e, started)
+                    if delay is None:
+                        raise
+                    time.sleep(delay)
         return wrapper
     return decorator
 
 
+def job_key_set(jobs: Iterable[Tuple[str, str]]) -> Set[str]:
+    """Normalized dedup keys for (title, company) pairs."""
+    return {_normalize_job_key(title, company) for title, company in jobs}
+
+
 def deduplicate_jobs(
     new_jobs: List[Dict[str, Any]], 
-    existing_jobs: List[Tuple[str, str]]
+    existing_jobs: List[Tuple[str, str]],
+    seen_keys: Optional[Set[str]] = None
 ) -> List[Dict[str, Any]]:
     """
     Remove duplicate jobs based on title and company.
@@ -43,36 +80,142 @@ def deduplicate_jobs(
     Args:
         new_jobs: List of newly scraped job dictionaries.
         existing_jobs: List of (title, company) tuples from storage.
+        seen_keys: Optional job_key_set() built once by the caller; used
+            instead of re-normalizing existing_jobs, and updated with the
+            keys of the returned jobs (for repeated calls over batches).
         
     Returns:
         List of unique jobs not in existing_jobs.
     """
-    existing_keys = set()
-    for title, company in existing_jobs:
-        key = _normalize_job_key(title, company)
-        existing_keys.add(key)
+    if seen_keys is None:
+        seen_keys = job_key_set(existing_jobs)
     
     unique_jobs = []
-    seen_in_batch = set()
-    
     for job in new_jobs:
-        key = _normalize_job_key(
-            job.get('title', ''),
-            job.get('company', '')
-        )
-        
-        if key not in existing_keys and key not in seen_in_batch:
-            seen_in_batch.add(key)
+        key = _normalize_job_key(job.get('title', ''), job.get('company', ''))
+        if key not in seen_keys:
+            seen_keys.add(key)
             unique_jobs.append(job)
     
     logger.info(f"Deduplication: {len(new_jobs)} -> {len(unique_jobs)} unique jobs")
     return unique_jobs
 
 
+# Title abbreviations expanded before fuzzy comparison
+_TITLE_ABBREVIATIONS = {
+    'sr': 'senior', 'jr': 'junior', 'snr': 'senior',
+    'eng': 'engineer', 'engr': 'engineer', 'mgr': 'manager', 'dev': 'developer',
+}
+
+
+def fuzzy_key_index(jobs: Iterable[Tuple[str, str]]) -> Dict[str, List[str]]:
+    """Fuzzy title keys of (title, company) pairs, grouped by normalized company."""
+    index = defaultdict(list)
+    for title, company in jobs:
+        title_key, company_key = _fuzzy_keys(title, company)
+        index[company_key].append(title_key)
+    return index
+
+
+def fuzzy_deduplicate_jobs(
+    jobs: List[Dict[str, Any]],
+    existing_jobs: Optional[List[Tuple[str, str]]] = None,
+    threshold: float = 0.92,
+    index: Optional[Dict[str, List[str]]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Remove near-duplicate jobs (e.g. "Sr. ML Engineer" vs "Senior ML Engineer").
+    
+    Titles are only compared within the same normalized company, so the
+    number of comparisons stays small, and titles with different level
+    or numeral tokens ("Engineer II" vs "Engineer III") never match.
+    Jobs are visited best first (highest combined_score if the jobs are
+    already scored, otherwise in order) and each is dropped only if it is
+    itself similar to an existing job or to a job already kept.
+    
+    Args:
+        jobs: List of job dictionaries (already exact-deduplicated).
+        existing_jobs: Optional (title, company) tuples from storage.
+        threshold: Minimum title similarity ratio (0-1) to treat as duplicate.
+        index: Optional fuzzy_key_index() built once by the caller; used
+            instead of existing_jobs, and updated with the returned jobs.
+        
+    Returns:
+        List of jobs without near-duplicates, in original order.
+    """
+    if index is None:
+        index = fuzzy_key_index(existing_jobs or ())
+    
+    keys = [_fuzzy_keys(job.get('title', ''), job.get('company', '')) for job in jobs]
+    order = sorted(range(len(jobs)), key=lambda i: (-jobs[i].get('combined_score', 0), i))
+    
+    keep = set()
+    for i in order:
+        title_key, company_key = keys[i]
+        candidates = index.setdefault(company_key, [])
+        match = next((other for other in candidates if _titles_similar(title_key, other, threshold)), None)
+        if match is not None:
+            logger.debug(f"Fuzzy duplicate: '{jobs[i].get('title', '')}' ~ '{match}' at {jobs[i].get('company', '')}")
+            continue
+        keep.add(i)
+        candidates.append(title_key)
+    
+    unique_jobs = [job for i, job in enumerate(jobs) if i in keep]
+    if len(unique_jobs) != len(jobs):
+        logger.info(f"Fuzzy deduplication: {len(jobs)} -> {len(unique_jobs)} unique jobs")
+    return unique_jobs
+
+
+def _fuzzy_keys(title: str, company: str) -> Tuple[str, str]:
+    """Normalized (title, company) with common title abbreviations expanded."""
+    title_key, company_key = _normalize_job_key(title, company).split('|', 1)
+    title_key = ' '.join(_TITLE_ABBREVIATIONS.get(word, word) for word in title_key.split())
+    return title_key, company_key
+
+
+# Title words that distinguish otherwise similar postings; must match exactly
+_LEVEL_TOKENS = frozenset({
+    'i', 'ii', 'iii', 'iv', 'v', 'vi', 'intern', 'junior', 'associate', 'mid',
+    'senior', 'staff', 'principal', 'lead', 'distinguished', 'head', 'manager', 'director',
+})
+
+
+def _level_tokens(title_key: str) -> Set[str]:
+    """Level and numeral words of a fuzzy title key."""
+    return {word for word in title_key.split() if word in _LEVEL_TOKENS or word.isdigit()}
+
+
+def _titles_similar(a: str, b: str, threshold: float) -> bool:
+    """True if two normalized titles are at least threshold similar."""
+    if a == b:
+        return True
+    if _level_tokens(a) != _level_tokens(b):
+        return False
+    matcher = SequenceMatcher(None, a, b)
+    # Cheap upper bounds first; ratio() is the expensive call
+    return (
+        matcher.real_quick_ratio() >= threshold
+        and matcher.quick_ratio() >= threshold
+        and matcher.ratio() >= threshold
+    )
+
+
+# ASCII characters that are neither alphanumeric nor whitespace, deleted via bytes.translate
+_NON_KEY_ASCII = bytes(c for c in range(128) if not (chr(c).isalnum() or chr(c).isspace()))
+
+
+def _key_chars(text: str) -> str:
+    """Lowercase text and keep only alphanumerics and whitespace."""
+    if text.isascii():
+        # bytes.translate deletes through a 256-entry table in C
+        return text.lower().encode('ascii').translate(None, _NON_KEY_ASCII).decode('ascii')
+    return ''.join(c.lower() for c in text if c.isalnum() or c.isspace())
+
+
 def _normalize_job_key(title: str, company: str) -> str:
     """Create a normalized key for job deduplication."""
-    title = ''.join(c.lower() for c in title if c.isalnum() or c.isspace())
-    company = ''.join(c.lower() for c in company if c.isalnum() or c.isspace())
+    title = _key_chars(title)
+    company = _key_chars(company)
     return f"{' '.join(title.split())}|{' '.join(company.split())}"
 
 
@@ -83,29 +226,37 @@ def format_job_for_storage(job: Dict[str, Any]) -> List[Any]:
     Returns:
         List of values for CSV row.
     """
+    get = job.get
     return [
-        job.get('date_posted', datetime.now().strftime('%Y-%m-%d')),
-        job.get('title', 'Unknown'),
-        job.get('company', 'Unknown'),
-        job.get('location', 'Remote'),
-        job.get('link', ''),
-        job.get('source', 'Unknown'),
-        job.get('relevance_score', 0),
-        job.get('match_score', 0),
-        job.get('combined_score', 0),
+        job['date_posted'] if 'date_posted' in job else _today(int(time.time() // 60)),
+        get('title', 'Unknown'),
+        get('company', 'Unknown'),
+        get('location', 'Remote'),
+        get('link', ''),
+        get('source', 'Unknown'),
+        get('relevance_score', 0),
+        get('match_score', 0),
+        get('combined_score', 0),
         'New',
-        ', '.join(job.get('matching_skills', [])[:5]),
-        ', '.join(job.get('missing_skills', [])[:5]),
-        job.get('salary', ''),
-        job.get('job_type', ''),
+        ', '.join(get('matching_skills', [])[:5]),
+        ', '.join(get('missing_skills', [])[:5]),
+        get('salary', ''),
+        get('job_type', ''),
     ]
 
 
+@functools.lru_cache(maxsize=1)
+def _today(minute: int) -> str:
+    """Today's date as YYYY-MM-DD, recomputed when the minute changes."""
+    return datetime.now().strftime('%Y-%m-%d')
+
+
 def clean_text(text: str) -> str:
     """Clean text by removing extra whitespace."""
     if not text:
         return ""
-    return ' '.join(text.split()).strip()
+    # split()/join() drops outer whitespace too, so no strip() is needed
+    return ' '.join(text.split())
 
 
 def truncate_text(text: str, max_length: int = 100, suffix: str = "...") -> str:
@@ -120,6 +271,10 @@ def is_valid_url(url: str) -> bool:
     return bool(url) and url.startswith(('http://', 'https://'))
 
 
+# Numbers in a salary string (commas already removed)
+_SALARY_NUMBER_RE = re.compile(r'\d+(?:\.\d+)?')
+
+
 def parse_salary(salary_str: str) -> Dict[str, Any]:
     """
     Parse salary string to extract min/max values.
@@ -127,8 +282,6 @@ def parse_salary(salary_str: str) -> Dict[str, Any]:
     Returns:
         Dictionary with 'min', 'max', 'currency'.
     """
-    import re
-    
     result = {'min': None, 'max': None, 'currency': 'USD', 'raw': salary_str}
     
     if not salary_str:
@@ -141,8 +294,7 @@ def parse_salary(salary_str: str) -> Dict[str, Any]:
         result['currency'] = 'EUR'
     
     # Find numbers
-    numbers = re.findall(r'[\d,]+(?:\.\d+)?', salary_str.replace(',', ''))
-    numbers = [float(n) for n in numbers if n]
+    numbers = [float(n) for n in _SALARY_NUMBER_RE.findall(salary_str.replace(',', ''))]
     
     # Handle 'k' suffix
     if 'k' in salary_str.lower():